@@ -1,6 +1,8 @@
 """Reusable UI components for IronLog."""
 
-from typing import Callable, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Generator, Optional
 
 import toga
 from toga.style import Pack
@@ -9,6 +11,161 @@ from toga.style.pack import BOLD, CENTER, COLUMN, ROW
 from app.ui.theme import Theme
 
 
+@lru_cache(maxsize=256)
+def _pack(**kwargs: object) -> Pack:
+    """
+    Get a shared Pack for the given style properties.
+
+    Widgets copy their style on assignment, so a single cached Pack can
+    safely back any number of widgets.
+    """
+    return Pack(**kwargs)
+
+
+# Styles for helpers that always render identically
+_FLEX_SPACER_STYLE = Pack(flex=1)
+_DIVIDER_STYLE = Pack(padding_top=Theme.SPACING_SM, padding_bottom=Theme.SPACING_SM)
+
+# Button styles by variant
+_BUTTON_VARIANTS: dict[str, Pack] = {
+    "primary": Pack(
+        padding=Theme.SPACING_BASE,
+        height=Theme.BUTTON_HEIGHT_XL,
+        background_color=Theme.PRIMARY,
+        color=Theme.TEXT_PRIMARY,
+        font_size=Theme.FONT_SIZE_LG,
+        font_weight=BOLD,
+        flex=1,
+    ),
+    "primary_disabled": Pack(
+        padding=Theme.SPACING_BASE,
+        height=Theme.BUTTON_HEIGHT_XL,
+        background_color=Theme.SURFACE,
+        color=Theme.TEXT_PRIMARY,
+        font_size=Theme.FONT_SIZE_LG,
+        font_weight=BOLD,
+        flex=1,
+    ),
+    "secondary": Pack(
+        padding=Theme.SPACING_MD,
+        height=Theme.BUTTON_HEIGHT_MD,
+        background_color=Theme.SURFACE,
+        color=Theme.TEXT_PRIMARY,
+        font_size=Theme.FONT_SIZE_BASE,
+        flex=1,
+    ),
+    "danger": Pack(
+        padding=Theme.SPACING_MD,
+        height=Theme.BUTTON_HEIGHT_MD,
+        background_color=Theme.DANGER,
+        color=Theme.TEXT_PRIMARY,
+        font_size=Theme.FONT_SIZE_BASE,
+        flex=1,
+    ),
+    "text": Pack(
+        padding=Theme.SPACING_SM,
+        height=Theme.BUTTON_HEIGHT_SM,
+        background_color=Theme.BACKGROUND,
+        color=Theme.PRIMARY,
+        font_size=Theme.FONT_SIZE_BASE,
+    ),
+    "surface_card": Pack(
+        padding=Theme.SPACING_BASE,
+        background_color=Theme.SURFACE,
+        color=Theme.TEXT_PRIMARY,
+        font_size=Theme.FONT_SIZE_BASE,
+        flex=1,
+        text_align=CENTER,
+    ),
+    "surface_card_compact": Pack(
+        padding=Theme.SPACING_MD,
+        background_color=Theme.SURFACE,
+        color=Theme.TEXT_PRIMARY,
+        font_size=Theme.FONT_SIZE_BASE,
+        flex=1,
+        text_align=CENTER,
+    ),
+}
+
+# chip_button styles, indexed by the selected flag
+_CHIP_STYLES = (
+    Pack(
+        padding_left=Theme.SPACING_MD,
+        padding_right=Theme.SPACING_MD,
+        padding_top=Theme.SPACING_SM,
+        padding_bottom=Theme.SPACING_SM,
+        height=Theme.BUTTON_HEIGHT_SM,
+        background_color=Theme.SURFACE,
+        color=Theme.TEXT_SECONDARY,
+        font_size=Theme.FONT_SIZE_SM,
+    ),
+    Pack(
+        padding_left=Theme.SPACING_MD,
+        padding_right=Theme.SPACING_MD,
+        padding_top=Theme.SPACING_SM,
+        padding_bottom=Theme.SPACING_SM,
+        height=Theme.BUTTON_HEIGHT_SM,
+        background_color=Theme.PRIMARY_MUTED,
+        color=Theme.PRIMARY,
+        font_size=Theme.FONT_SIZE_SM,
+    ),
+)
+
+# list_item styles
+_LIST_ITEM_STYLE = Pack(
+    direction=ROW,
+    padding=Theme.SPACING_BASE,
+    background_color=Theme.SURFACE,
+    alignment=CENTER,
+)
+_LIST_ITEM_LEFT_STYLE = Pack(direction=COLUMN, flex=1)
+_LIST_ITEM_TITLE_STYLE = Pack(font_size=Theme.FONT_SIZE_BASE, color=Theme.TEXT_PRIMARY)
+_LIST_ITEM_SUBTITLE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_top=Theme.SPACING_XS,
+)
+_LIST_ITEM_RIGHT_STYLE = Pack(font_size=Theme.FONT_SIZE_SM, color=Theme.TEXT_SECONDARY)
+_CHEVRON_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_XL,
+    color=Theme.TEXT_TERTIARY,
+    padding_left=Theme.SPACING_SM,
+)
+
+# Width reserved for a missing header_bar button
+_HEADER_BUTTON_WIDTH = 60
+
+# Shared "no children" value; toga.Box accepts any iterable
+_EMPTY: tuple = ()
+
+
+@contextmanager
+def defer_layout(widget: toga.Widget) -> Generator[toga.Widget, None, None]:
+    """
+    Hold off native relayout of a displayed widget while it is changed.
+
+    Backends whose native controls support SuspendLayout/ResumeLayout
+    (Winforms) lay the widget out once when the block exits instead of
+    after every added or removed child. Elsewhere this is a no-op.
+
+    Args:
+        widget: Widget whose children are about to change
+
+    Yields:
+        The same widget
+    """
+    native = getattr(widget._impl, "native", None)
+    if not hasattr(native, "SuspendLayout"):
+        yield widget
+        return
+
+    native.SuspendLayout()
+    try:
+        yield widget
+    finally:
+        native.ResumeLayout(True)
+
+
 def styled_box(
     children: Optional[list] = None,
     direction: str = COLUMN,
@@ -18,8 +175,8 @@ def styled_box(
 ) -> toga.Box:
     """Create a styled box container."""
     box = toga.Box(
-        children=children or [],
-        style=Pack(
+        children=children if children else _EMPTY,
+        style=_pack(
             direction=direction,
             padding=padding,
             background_color=background,
@@ -32,8 +189,8 @@ def styled_box(
 def screen_container(children: Optional[list] = None) -> toga.Box:
     """Create a full-screen container with dark background."""
     return toga.Box(
-        children=children or [],
-        style=Pack(
+        children=children if children else _EMPTY,
+        style=_pack(
             direction=COLUMN,
             padding=Theme.SPACING_BASE,
             background_color=Theme.BACKGROUND,
@@ -45,8 +202,8 @@ def screen_container(children: Optional[list] = None) -> toga.Box:
 def card(children: Optional[list] = None, on_press: Optional[Callable] = None) -> toga.Box:
     """Create a card component."""
     box = toga.Box(
-        children=children or [],
-        style=Pack(
+        children=children if children else _EMPTY,
+        style=_pack(
             direction=COLUMN,
             padding=Theme.CARD_PADDING,
             background_color=Theme.SURFACE,
@@ -58,24 +215,24 @@ def card(children: Optional[list] = None, on_press: Optional[Callable] = None) -
 
 def spacer(size: int = Theme.SPACING_BASE) -> toga.Box:
     """Create a vertical spacer."""
-    return toga.Box(style=Pack(height=size))
+    return toga.Box(style=_pack(height=size))
 
 
 def horizontal_spacer(size: int = Theme.SPACING_BASE) -> toga.Box:
     """Create a horizontal spacer."""
-    return toga.Box(style=Pack(width=size))
+    return toga.Box(style=_pack(width=size))
 
 
 def flex_spacer() -> toga.Box:
     """Create a flexible spacer that expands to fill space."""
-    return toga.Box(style=Pack(flex=1))
+    return toga.Box(style=_FLEX_SPACER_STYLE)
 
 
 def title_text(text: str, size: int = Theme.FONT_SIZE_2XL) -> toga.Label:
     """Create a title label."""
     return toga.Label(
         text=text,
-        style=Pack(
+        style=_pack(
             font_size=size,
             font_weight=BOLD,
             color=Theme.TEXT_PRIMARY,
@@ -88,7 +245,7 @@ def subtitle_text(text: str) -> toga.Label:
     """Create a subtitle label."""
     return toga.Label(
         text=text,
-        style=Pack(
+        style=_pack(
             font_size=Theme.FONT_SIZE_LG,
             color=Theme.TEXT_SECONDARY,
         ),
@@ -99,7 +256,7 @@ def body_text(text: str, color: str = Theme.TEXT_PRIMARY) -> toga.Label:
     """Create body text."""
     return toga.Label(
         text=text,
-        style=Pack(
+        style=_pack(
             font_size=Theme.FONT_SIZE_BASE,
             color=color,
         ),
@@ -110,7 +267,7 @@ def secondary_text(text: str) -> toga.Label:
     """Create secondary/muted text."""
     return toga.Label(
         text=text,
-        style=Pack(
+        style=_pack(
             font_size=Theme.FONT_SIZE_SM,
             color=Theme.TEXT_SECONDARY,
         ),
@@ -121,7 +278,7 @@ def timer_display(time_str: str = "0:00", color: str = Theme.TIMER) -> toga.Labe
     """Create a large timer display."""
     return toga.Label(
         text=time_str,
-        style=Pack(
+        style=_pack(
             font_size=Theme.FONT_SIZE_TIMER,
             font_weight=BOLD,
             color=color,
@@ -130,47 +287,37 @@ def timer_display(time_str: str = "0:00", color: str = Theme.TIMER) -> toga.Labe
     )
 
 
-def primary_button(
+def _button(
+    variant: str,
     text: str,
     on_press: Optional[Callable] = None,
     enabled: bool = True,
 ) -> toga.Button:
-    """Create a primary action button."""
+    """Create a button styled by one of the prebuilt variants."""
     return toga.Button(
         text=text,
         on_press=on_press,
         enabled=enabled,
-        style=Pack(
-            padding=Theme.SPACING_BASE,
-            height=Theme.BUTTON_HEIGHT_XL,
-            background_color=Theme.PRIMARY if enabled else Theme.SURFACE,
-            color=Theme.TEXT_PRIMARY,
-            font_size=Theme.FONT_SIZE_LG,
-            font_weight=BOLD,
-            flex=1,
-        ),
+        style=_BUTTON_VARIANTS[variant],
     )
 
 
+def primary_button(
+    text: str,
+    on_press: Optional[Callable] = None,
+    enabled: bool = True,
+) -> toga.Button:
+    """Create a primary action button."""
+    return _button("primary" if enabled else "primary_disabled", text, on_press, enabled)
+
+
 def secondary_button(
     text: str,
     on_press: Optional[Callable] = None,
     enabled: bool = True,
 ) -> toga.Button:
     """Create a secondary action button."""
-    return toga.Button(
-        text=text,
-        on_press=on_press,
-        enabled=enabled,
-        style=Pack(
-            padding=Theme.SPACING_MD,
-            height=Theme.BUTTON_HEIGHT_MD,
-            background_color=Theme.SURFACE,
-            color=Theme.TEXT_PRIMARY,
-            font_size=Theme.FONT_SIZE_BASE,
-            flex=1,
-        ),
-    )
+    return _button("secondary", text, on_press, enabled)
 
 
 def danger_button(
@@ -178,18 +325,7 @@ def danger_button(
     on_press: Optional[Callable] = None,
 ) -> toga.Button:
     """Create a danger/destructive button."""
-    return toga.Button(
-        text=text,
-        on_press=on_press,
-        style=Pack(
-            padding=Theme.SPACING_MD,
-            height=Theme.BUTTON_HEIGHT_MD,
-            background_color=Theme.DANGER,
-            color=Theme.TEXT_PRIMARY,
-            font_size=Theme.FONT_SIZE_BASE,
-            flex=1,
-        ),
-    )
+    return _button("danger", text, on_press)
 
 
 def text_button(
@@ -198,10 +334,12 @@ def text_button(
     color: str = Theme.PRIMARY,
 ) -> toga.Button:
     """Create a text-only button."""
+    if color == Theme.PRIMARY:
+        return _button("text", text, on_press)
     return toga.Button(
         text=text,
         on_press=on_press,
-        style=Pack(
+        style=_pack(
             padding=Theme.SPACING_SM,
             height=Theme.BUTTON_HEIGHT_SM,
             background_color=Theme.BACKGROUND,
@@ -211,26 +349,22 @@ def text_button(
     )
 
 
+def surface_card_button(
+    text: str,
+    on_press: Optional[Callable] = None,
+    compact: bool = False,
+) -> toga.Button:
+    """Create a full-width, centered button styled as a list card."""
+    return _button("surface_card_compact" if compact else "surface_card", text, on_press)
+
+
 def chip_button(
     text: str,
     on_press: Optional[Callable] = None,
     selected: bool = False,
 ) -> toga.Button:
     """Create a chip/tag button for quick-add."""
-    return toga.Button(
-        text=text,
-        on_press=on_press,
-        style=Pack(
-            padding_left=Theme.SPACING_MD,
-            padding_right=Theme.SPACING_MD,
-            padding_top=Theme.SPACING_SM,
-            padding_bottom=Theme.SPACING_SM,
-            height=Theme.BUTTON_HEIGHT_SM,
-            background_color=Theme.PRIMARY_MUTED if selected else Theme.SURFACE,
-            color=Theme.PRIMARY if selected else Theme.TEXT_SECONDARY,
-            font_size=Theme.FONT_SIZE_SM,
-        ),
-    )
+    return toga.Button(text=text, on_press=on_press, style=_CHIP_STYLES[selected])
 
 
 def number_input(
@@ -243,7 +377,7 @@ def number_input(
         value=value,
         placeholder=placeholder,
         on_change=on_change,
-        style=Pack(
+        style=_pack(
             padding=Theme.SPACING_MD,
             height=Theme.BUTTON_HEIGHT_LG,
             background_color=Theme.SURFACE,
@@ -264,7 +398,7 @@ def text_input(
         value=value,
         placeholder=placeholder,
         on_change=on_change,
-        style=Pack(
+        style=_pack(
             padding=Theme.SPACING_MD,
             height=Theme.BUTTON_HEIGHT_MD,
             background_color=Theme.SURFACE,
@@ -277,24 +411,19 @@ def text_input(
 
 def divider() -> toga.Divider:
     """Create a horizontal divider."""
-    return toga.Divider(
-        style=Pack(
-            padding_top=Theme.SPACING_SM,
-            padding_bottom=Theme.SPACING_SM,
-        )
-    )
+    return toga.Divider(style=_DIVIDER_STYLE)
 
 
 def row(*children, padding: int = 0, spacing: int = Theme.SPACING_SM) -> toga.Box:
     """Create a horizontal row of items."""
-    items = []
-    for i, child in enumerate(children):
-        items.append(child)
-        if i < len(children) - 1 and spacing > 0:
+    items: list[toga.Widget] = []
+    for child in children:
+        if items and spacing > 0:
             items.append(horizontal_spacer(spacing))
+        items.append(child)
     return toga.Box(
         children=items,
-        style=Pack(
+        style=_pack(
             direction=ROW,
             padding=padding,
             alignment=CENTER,
@@ -302,36 +431,44 @@ def row(*children, padding: int = 0, spacing: int = Theme.SPACING_SM) -> toga.Bo
     )
 
 
+def _empty_state_title(text: str) -> toga.Label:
+    """Create the headline label of an empty state."""
+    return toga.Label(
+        text=text,
+        style=_pack(
+            font_size=Theme.FONT_SIZE_LG,
+            color=Theme.TEXT_TERTIARY,
+            text_align=CENTER,
+        ),
+    )
+
+
+def _empty_state_subtitle(text: str) -> toga.Label:
+    """Create the hint label of an empty state."""
+    return toga.Label(
+        text=text,
+        style=_pack(
+            font_size=Theme.FONT_SIZE_SM,
+            color=Theme.TEXT_TERTIARY,
+            text_align=CENTER,
+        ),
+    )
+
+
 def empty_state(title: str, subtitle: str = "") -> toga.Box:
     """Create an empty state display."""
     children = [
         spacer(Theme.SPACING_4XL),
-        toga.Label(
-            text=title,
-            style=Pack(
-                font_size=Theme.FONT_SIZE_LG,
-                color=Theme.TEXT_TERTIARY,
-                text_align=CENTER,
-            ),
-        ),
+        _empty_state_title(title),
     ]
     if subtitle:
         children.append(spacer(Theme.SPACING_SM))
-        children.append(
-            toga.Label(
-                text=subtitle,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_TERTIARY,
-                    text_align=CENTER,
-                ),
-            )
-        )
+        children.append(_empty_state_subtitle(subtitle))
     children.append(flex_spacer())
 
     return toga.Box(
         children=children,
-        style=Pack(
+        style=_pack(
             direction=COLUMN,
             alignment=CENTER,
             flex=1,
@@ -340,6 +477,11 @@ def empty_state(title: str, subtitle: str = "") -> toga.Box:
     )
 
 
+def _make_chevron() -> toga.Label:
+    """Create the trailing chevron indicator for a list item."""
+    return toga.Label(text="›", style=_CHEVRON_STYLE)
+
+
 def list_item(
     title: str,
     subtitle: str = "",
@@ -347,65 +489,26 @@ def list_item(
     on_press: Optional[Callable] = None,
 ) -> toga.Box:
     """Create a list item row."""
-    left_content = [
-        toga.Label(
-            text=title,
-            style=Pack(
-                font_size=Theme.FONT_SIZE_BASE,
-                color=Theme.TEXT_PRIMARY,
-            ),
-        ),
-    ]
+    left_content = [toga.Label(text=title, style=_LIST_ITEM_TITLE_STYLE)]
     if subtitle:
-        left_content.append(
-            toga.Label(
-                text=subtitle,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_top=Theme.SPACING_XS,
-                ),
-            )
-        )
+        left_content.append(toga.Label(text=subtitle, style=_LIST_ITEM_SUBTITLE_STYLE))
 
     left_box = toga.Box(
         children=left_content,
-        style=Pack(direction=COLUMN, flex=1),
+        style=_LIST_ITEM_LEFT_STYLE,
     )
 
     children = [left_box]
 
     if right_text:
-        children.append(
-            toga.Label(
-                text=right_text,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                ),
-            )
-        )
+        children.append(toga.Label(text=right_text, style=_LIST_ITEM_RIGHT_STYLE))
 
     # Add chevron indicator
-    children.append(
-        toga.Label(
-            text="›",
-            style=Pack(
-                font_size=Theme.FONT_SIZE_XL,
-                color=Theme.TEXT_TERTIARY,
-                padding_left=Theme.SPACING_SM,
-            ),
-        )
-    )
+    children.append(_make_chevron())
 
     return toga.Box(
         children=children,
-        style=Pack(
-            direction=ROW,
-            padding=Theme.SPACING_BASE,
-            background_color=Theme.SURFACE,
-            alignment=CENTER,
-        ),
+        style=_LIST_ITEM_STYLE,
     )
 
 
@@ -419,30 +522,29 @@ def header_bar(
 
     if left_button:
         children.append(left_button)
-    else:
-        children.append(toga.Box(style=Pack(width=60)))  # Placeholder for alignment
 
-    children.append(flex_spacer())
+    children.append(toga.Box(style=_FLEX_SPACER_STYLE))
+    # Pad the title where a button is missing to keep it centered
     children.append(
         toga.Label(
             text=title,
-            style=Pack(
+            style=_pack(
                 font_size=Theme.FONT_SIZE_LG,
                 font_weight=BOLD,
                 color=Theme.TEXT_PRIMARY,
+                padding_left=0 if left_button else _HEADER_BUTTON_WIDTH,
+                padding_right=0 if right_button else _HEADER_BUTTON_WIDTH,
             ),
         )
     )
-    children.append(flex_spacer())
+    children.append(toga.Box(style=_FLEX_SPACER_STYLE))
 
     if right_button:
         children.append(right_button)
-    else:
-        children.append(toga.Box(style=Pack(width=60)))  # Placeholder for alignment
 
     return toga.Box(
         children=children,
-        style=Pack(
+        style=_pack(
             direction=ROW,
             padding=Theme.SPACING_SM,
             background_color=Theme.BACKGROUND,
@@ -1,13 +1,46 @@
 """SQLite database connection and management."""
 
 import sqlite3
+import threading
 from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Generator, Iterable, Optional, Sequence
 
 from app.data.migrations import apply_migrations
 
 
+def _convert_timestamp(value: bytes) -> datetime:
+    """Parse a stored TIMESTAMP column value."""
+    return datetime.fromisoformat(value.decode())
+
+
+# datetime.fromisoformat is implemented in C and much cheaper than the
+# default regex/strptime-style timestamp converter
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
+# Bind datetimes as "YYYY-MM-DD HH:MM:SS[.ffffff]", the format already stored
+# (timestamps are compared and sorted as text). The partial calls straight
+# into the C isoformat without a Python frame, and does not rely on
+# sqlite3's built-in default adapter, deprecated as of Python 3.12.
+sqlite3.register_adapter(datetime, partial(datetime.isoformat, sep=" "))
+
+# Connection setup, applied once per connection. WAL allows concurrent reads
+# during writes; synchronous=NORMAL is durable under WAL (only the most recent
+# commits can be lost on power failure, never corrupting the database).
+# mmap_size lets reads come straight from the OS page cache instead of
+# going through read() into SQLite's own buffers.
+_PRAGMAS = """
+PRAGMA foreign_keys = ON;
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -8000;
+PRAGMA mmap_size = 268435456;
+"""
+
+
 class Database:
     """
     SQLite database connection manager.
@@ -15,7 +48,7 @@ class Database:
     Provides thread-safe database access with automatic migrations.
     """
 
-    _instance: Optional["Database"] = None
+    __slots__ = ("db_path", "_connection")
 
     def __init__(self, db_path: Optional[Path] = None) -> None:
         """
@@ -47,16 +80,23 @@ class Database:
         Returns:
             The database instance
         """
-        if cls._instance is None:
-            cls._instance = cls(db_path)
-        return cls._instance
+        global _INSTANCE
+        instance = _INSTANCE
+        if instance is not None:
+            return instance
+        with _INSTANCE_LOCK:
+            if _INSTANCE is None:
+                _INSTANCE = cls(db_path)
+            return _INSTANCE
 
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton instance. For testing only."""
-        if cls._instance is not None:
-            cls._instance.close()
-            cls._instance = None
+        global _INSTANCE
+        with _INSTANCE_LOCK:
+            if _INSTANCE is not None:
+                _INSTANCE.close()
+                _INSTANCE = None
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -68,13 +108,16 @@ class Database:
         if self._connection is None:
             self._connection = sqlite3.connect(
                 str(self.db_path),
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                # Only declared column types are converted; no query relies on
+                # "AS x [type]" column-name hints
+                detect_types=sqlite3.PARSE_DECLTYPES,
                 check_same_thread=False,
+                # Keep parsed statements for the repositories' fixed queries
+                cached_statements=256,
+                # Autocommit mode; transaction() issues BEGIN/COMMIT itself
+                isolation_level=None,
             )
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-            # Use WAL mode for better concurrent access
-            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.executescript(_PRAGMAS)
             # Row factory for dict-like access
             self._connection.row_factory = sqlite3.Row
 
@@ -83,9 +126,68 @@ class Database:
     def close(self) -> None:
         """Close the database connection."""
         if self._connection is not None:
+            # Refresh planner statistics if SQLite thinks they're stale
+            self._connection.execute("PRAGMA optimize")
             self._connection.close()
             self._connection = None
 
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """
+        Execute a single statement without opening a cursor context.
+
+        The connection runs in autocommit mode, so a lone write is atomic
+        and does not need a transaction() block.
+
+        Args:
+            sql: SQL statement to execute
+            params: Statement parameters
+
+        Returns:
+            Cursor holding any result rows
+        """
+        return self.connect().execute(sql, params)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> sqlite3.Cursor:
+        """
+        Execute a single statement against each parameter set.
+
+        Args:
+            sql: SQL statement to execute
+            seq_of_params: Parameter sets, one per execution
+
+        Returns:
+            Cursor used for the executions
+        """
+        return self.connect().executemany(sql, seq_of_params)
+
+    def bulk_insert(self, sql: str, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Insert many rows in a single transaction.
+
+        One transaction means one journal flush for the whole batch rather
+        than one per row.
+
+        Args:
+            sql: Parameterized INSERT statement
+            rows: Materialized parameter rows, one per insert
+        """
+        self._bulk_write(sql, rows)
+
+    def bulk_update(self, sql: str, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Apply an UPDATE (or DELETE) for many rows in a single transaction.
+
+        Args:
+            sql: Parameterized UPDATE or DELETE statement
+            rows: Materialized parameter rows, one per execution
+        """
+        self._bulk_write(sql, rows)
+
+    def _bulk_write(self, sql: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Run executemany for a write statement inside a transaction."""
+        with self.transaction() as cursor:
+            cursor.executemany(sql, rows)
+
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
         """
@@ -99,11 +201,12 @@ class Database:
         """
         conn = self.connect()
         cursor = conn.cursor()
+        cursor.execute("BEGIN")
         try:
             yield cursor
-            conn.commit()
+            cursor.execute("COMMIT")
         except Exception:
-            conn.rollback()
+            cursor.execute("ROLLBACK")
             raise
         finally:
             cursor.close()
@@ -123,13 +226,34 @@ class Database:
         finally:
             cursor.close()
 
+    @contextmanager
+    def tuple_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """
+        Context manager for read-only queries that return plain tuples.
+
+        Loops that unpack rows by position skip sqlite3.Row's per-column
+        name lookups.
+
+        Yields:
+            A cursor whose rows are tuples
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
     def initialize(self) -> None:
         """
         Initialize the database with schema and migrations.
 
         Should be called once at app startup.
         """
-        apply_migrations(self)
+        if apply_migrations(self):
+            # Gather planner statistics once the schema or seed data changed
+            self.execute("ANALYZE")
 
     def reset(self) -> None:
         """
@@ -144,6 +268,11 @@ class Database:
         self.initialize()
 
 
+# Singleton state; the lock is only taken until the instance exists
+_INSTANCE: Optional[Database] = None
+_INSTANCE_LOCK = threading.Lock()
+
+
 def get_db() -> Database:
     """
     Get the database instance.
@@ -151,4 +280,5 @@ def get_db() -> Database:
     Returns:
         The singleton database instance
     """
-    return Database.get_instance()
+    instance = _INSTANCE
+    return instance if instance is not None else Database.get_instance()
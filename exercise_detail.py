@@ -1,15 +1,19 @@
 """Exercise detail view for logging sets."""
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+from contextlib import suppress
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Callable, Optional
 from uuid import UUID
 
 import toga
 from toga.style import Pack
 from toga.style.pack import BOLD, CENTER, COLUMN, ROW
 
-from app.core.models import SessionExercise, Set, format_weight
+from app.core.models import SessionExercise, Set, format_set
 from app.ui.components import (
     chip_button,
+    defer_layout,
     flex_spacer,
     number_input,
     primary_button,
@@ -24,6 +28,114 @@ if TYPE_CHECKING:
     from app.main import IronLogApp
 
 
+# Seconds to wait after logging a set before writing queued sets, so
+# quickly logged sets share one transaction
+_SET_FLUSH_DELAY = 0.2
+
+# Layout
+_COLUMN_STYLE = Pack(direction=COLUMN)
+_ROW_STYLE = Pack(direction=ROW)
+_HEADER_STYLE = Pack(direction=ROW, padding_bottom=Theme.SPACING_SM)
+
+# Header and title
+_BACK_BUTTON_STYLE = Pack(
+    padding=Theme.SPACING_SM,
+    background_color=Theme.BACKGROUND,
+    color=Theme.PRIMARY,
+    font_size=Theme.FONT_SIZE_BASE,
+)
+_DELETE_BUTTON_STYLE = Pack(
+    padding=Theme.SPACING_SM,
+    background_color=Theme.BACKGROUND,
+    color=Theme.DANGER,
+    font_size=Theme.FONT_SIZE_SM,
+)
+_TITLE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_2XL,
+    font_weight=BOLD,
+    color=Theme.TEXT_PRIMARY,
+    padding_bottom=Theme.SPACING_SM,
+)
+_BODYWEIGHT_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_bottom=Theme.SPACING_LG,
+)
+_NOT_FOUND_STYLE = Pack(color=Theme.TEXT_TERTIARY)
+
+# Inputs and quick-add chips
+_INPUT_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_bottom=Theme.SPACING_XS,
+)
+_INPUT_STYLE = Pack(
+    padding=Theme.SPACING_MD,
+    height=Theme.BUTTON_HEIGHT_LG,
+    background_color=Theme.SURFACE,
+    color=Theme.TEXT_PRIMARY,
+    font_size=Theme.FONT_SIZE_2XL,
+)
+_CHIP_STYLE = Pack(
+    padding_left=Theme.SPACING_MD,
+    padding_right=Theme.SPACING_MD,
+    padding_top=Theme.SPACING_SM,
+    padding_bottom=Theme.SPACING_SM,
+    background_color=Theme.SURFACE,
+    color=Theme.TEXT_SECONDARY,
+    font_size=Theme.FONT_SIZE_SM,
+)
+_CHIP_ACCENT_STYLE = Pack(
+    padding_left=Theme.SPACING_MD,
+    padding_right=Theme.SPACING_MD,
+    padding_top=Theme.SPACING_SM,
+    padding_bottom=Theme.SPACING_SM,
+    background_color=Theme.PRIMARY_MUTED,
+    color=Theme.PRIMARY,
+    font_size=Theme.FONT_SIZE_SM,
+)
+_CHIP_GAP_STYLE = Pack(width=Theme.SPACING_SM)
+_REPS_CHIP_TEXTS = tuple(str(reps) for reps in Theme.QUICK_REPS)
+# Signed weight adjustments; the chip handler parses the delta back out
+_WEIGHT_CHIP_TEXTS = tuple(
+    f"{delta:+d}"
+    for delta in (
+        Theme.WEIGHT_INCREMENT_SMALL,
+        Theme.WEIGHT_INCREMENT_LARGE,
+        -Theme.WEIGHT_INCREMENT_SMALL,
+    )
+)
+
+# Set history
+_HISTORY_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_bottom=Theme.SPACING_SM,
+)
+_EMPTY_HISTORY_STYLE = Pack(direction=COLUMN, alignment=CENTER)
+_EMPTY_HISTORY_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_TERTIARY,
+    text_align=CENTER,
+)
+_SET_ROW_STYLE = Pack(
+    direction=ROW,
+    padding=Theme.SPACING_SM,
+    background_color=Theme.SURFACE,
+    alignment=CENTER,
+)
+_SET_NUMBER_STYLE = Pack(font_size=Theme.FONT_SIZE_SM, color=Theme.TEXT_SECONDARY, width=60)
+_SET_TEXT_STYLE = Pack(font_size=Theme.FONT_SIZE_BASE, color=Theme.TEXT_PRIMARY, flex=1)
+_SHOW_OLDER_STYLE = Pack(direction=ROW, padding_top=Theme.SPACING_SM)
+_SET_DELETE_STYLE = Pack(
+    padding=Theme.SPACING_XS,
+    background_color=Theme.SURFACE,
+    color=Theme.TEXT_TERTIARY,
+    font_size=Theme.FONT_SIZE_BASE,
+    width=30,
+)
+
+
 class ExerciseDetailView:
     """View for logging sets for a specific exercise."""
 
@@ -44,32 +156,40 @@ class ExerciseDetailView:
         self.current_reps: int = 0
         self.current_weight: Optional[float] = None
 
+        # Set history container, updated in place as sets are logged
+        self.history_box: Optional[toga.Box] = None
+        # Number of sets (newest first) currently shown in the history
+        self._history_offset = 0
+        # Whether a write of queued sets is already pending
+        self._flush_scheduled = False
+
         # Load exercise
         self.refresh_exercise()
 
-        # Get last used weight for this exercise
-        self.last_weight = self.app.session_repo.get_last_weight_for_exercise(
-            self.exercise.name if self.exercise else ""
-        )
+    @cached_property
+    def last_weight(self) -> Optional[float]:
+        """Last weight used for this exercise, looked up on first use."""
+        if not self.exercise or not self.exercise.uses_weight:
+            return None
+        return self.app.session_repo.get_last_weight_for_exercise(self.exercise.name)
 
     def refresh_exercise(self) -> None:
         """Reload exercise from database."""
-        session = self.app.session_repo.get_by_id(self.session_id)
-        if session:
-            for ex in session.exercises:
-                if ex.id == self.exercise_id:
-                    self.exercise = ex
-                    break
+        exercise = self.app.session_repo.get_exercise_by_id(self.exercise_id)
+        if exercise and exercise.session_id == self.session_id:
+            self.exercise = exercise
 
     def create_view(self) -> toga.Box:
         """Create the exercise detail view."""
         if not self.exercise:
-            return screen_container([
-                toga.Label(
-                    text="Exercise not found",
-                    style=Pack(color=Theme.TEXT_TERTIARY),
-                )
-            ])
+            return screen_container(
+                [
+                    toga.Label(
+                        text="Exercise not found",
+                        style=_NOT_FOUND_STYLE,
+                    )
+                ]
+            )
 
         children = []
 
@@ -80,12 +200,7 @@ class ExerciseDetailView:
         children.append(
             toga.Label(
                 text=self.exercise.name,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_2XL,
-                    font_weight=BOLD,
-                    color=Theme.TEXT_PRIMARY,
-                    padding_bottom=Theme.SPACING_SM,
-                ),
+                style=_TITLE_STYLE,
             )
         )
 
@@ -94,11 +209,7 @@ class ExerciseDetailView:
             children.append(
                 toga.Label(
                     text="Bodyweight Exercise",
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_SM,
-                        color=Theme.TEXT_SECONDARY,
-                        padding_bottom=Theme.SPACING_LG,
-                    ),
+                    style=_BODYWEIGHT_LABEL_STYLE,
                 )
             )
 
@@ -132,20 +243,12 @@ class ExerciseDetailView:
                 toga.Button(
                     text="← Back",
                     on_press=on_back,
-                    style=Pack(
-                        padding=Theme.SPACING_SM,
-                        background_color=Theme.BACKGROUND,
-                        color=Theme.PRIMARY,
-                        font_size=Theme.FONT_SIZE_BASE,
-                    ),
+                    style=_BACK_BUTTON_STYLE,
                 ),
                 flex_spacer(),
                 self._create_delete_button(),
             ],
-            style=Pack(
-                direction=ROW,
-                padding_bottom=Theme.SPACING_SM,
-            ),
+            style=_HEADER_STYLE,
         )
 
     def _create_delete_button(self) -> toga.Button:
@@ -166,12 +269,7 @@ class ExerciseDetailView:
         return toga.Button(
             text="Delete",
             on_press=on_delete,
-            style=Pack(
-                padding=Theme.SPACING_SM,
-                background_color=Theme.BACKGROUND,
-                color=Theme.DANGER,
-                font_size=Theme.FONT_SIZE_SM,
-            ),
+            style=_DELETE_BUTTON_STYLE,
         )
 
     def _create_input_section(self) -> toga.Box:
@@ -182,23 +280,13 @@ class ExerciseDetailView:
         children.append(
             toga.Label(
                 text="Reps",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_bottom=Theme.SPACING_XS,
-                ),
+                style=_INPUT_LABEL_STYLE,
             )
         )
 
         self.reps_input = toga.TextInput(
             placeholder="0",
-            style=Pack(
-                padding=Theme.SPACING_MD,
-                height=Theme.BUTTON_HEIGHT_LG,
-                background_color=Theme.SURFACE,
-                color=Theme.TEXT_PRIMARY,
-                font_size=Theme.FONT_SIZE_2XL,
-            ),
+            style=_INPUT_STYLE,
         )
         children.append(self.reps_input)
 
@@ -213,11 +301,7 @@ class ExerciseDetailView:
             children.append(
                 toga.Label(
                     text="Weight (lbs)",
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_SM,
-                        color=Theme.TEXT_SECONDARY,
-                        padding_bottom=Theme.SPACING_XS,
-                    ),
+                    style=_INPUT_LABEL_STYLE,
                 )
             )
 
@@ -229,13 +313,7 @@ class ExerciseDetailView:
             self.weight_input = toga.TextInput(
                 value=default_weight,
                 placeholder="0",
-                style=Pack(
-                    padding=Theme.SPACING_MD,
-                    height=Theme.BUTTON_HEIGHT_LG,
-                    background_color=Theme.SURFACE,
-                    color=Theme.TEXT_PRIMARY,
-                    font_size=Theme.FONT_SIZE_2XL,
-                ),
+                style=_INPUT_STYLE,
             )
             children.append(self.weight_input)
 
@@ -245,35 +323,22 @@ class ExerciseDetailView:
 
         return toga.Box(
             children=children,
-            style=Pack(direction=COLUMN),
+            style=_COLUMN_STYLE,
         )
 
     def _create_reps_chips(self) -> toga.Box:
         """Create quick-add chips for common rep values."""
         chips = []
 
-        for reps in Theme.QUICK_REPS:
-
-            def on_chip(widget: toga.Widget, r: int = reps) -> None:
-                if self.reps_input:
-                    self.reps_input.value = str(r)
-
+        for text in _REPS_CHIP_TEXTS:
             chips.append(
                 toga.Button(
-                    text=str(reps),
-                    on_press=on_chip,
-                    style=Pack(
-                        padding_left=Theme.SPACING_MD,
-                        padding_right=Theme.SPACING_MD,
-                        padding_top=Theme.SPACING_SM,
-                        padding_bottom=Theme.SPACING_SM,
-                        background_color=Theme.SURFACE,
-                        color=Theme.TEXT_SECONDARY,
-                        font_size=Theme.FONT_SIZE_SM,
-                    ),
+                    text=text,
+                    on_press=self._on_reps_chip,
+                    style=_CHIP_STYLE,
                 )
             )
-            chips.append(toga.Box(style=Pack(width=Theme.SPACING_SM)))
+            chips.append(toga.Box(style=_CHIP_GAP_STYLE))
 
         # Copy last set button
         if self.exercise and self.exercise.sets:
@@ -289,113 +354,55 @@ class ExerciseDetailView:
                 toga.Button(
                     text="Copy Last",
                     on_press=on_copy_last,
-                    style=Pack(
-                        padding_left=Theme.SPACING_MD,
-                        padding_right=Theme.SPACING_MD,
-                        padding_top=Theme.SPACING_SM,
-                        padding_bottom=Theme.SPACING_SM,
-                        background_color=Theme.PRIMARY_MUTED,
-                        color=Theme.PRIMARY,
-                        font_size=Theme.FONT_SIZE_SM,
-                    ),
+                    style=_CHIP_ACCENT_STYLE,
                 )
             )
 
         return toga.Box(
             children=chips,
-            style=Pack(direction=ROW),
+            style=_ROW_STYLE,
         )
 
+    def _on_reps_chip(self, widget: toga.Widget) -> None:
+        """Fill the reps input from a rep chip; the chip text is the value."""
+        if self.reps_input:
+            self.reps_input.value = widget.text
+
     def _create_weight_chips(self) -> toga.Box:
         """Create quick-add chips for weight adjustments."""
         if not self.exercise or not self.exercise.uses_weight:
             return toga.Box()
 
-        chips = []
-
-        # Get current weight value
-        def get_current_weight() -> float:
-            if self.weight_input and self.weight_input.value:
-                try:
-                    return float(self.weight_input.value)
-                except ValueError:
-                    pass
-            return self.last_weight or 0
-
-        # +5 button
-        def on_plus_5(widget: toga.Widget) -> None:
-            if self.weight_input:
-                current = get_current_weight()
-                self.weight_input.value = str(int(current + 5))
-
-        chips.append(
-            toga.Button(
-                text="+5",
-                on_press=on_plus_5,
-                style=Pack(
-                    padding_left=Theme.SPACING_MD,
-                    padding_right=Theme.SPACING_MD,
-                    padding_top=Theme.SPACING_SM,
-                    padding_bottom=Theme.SPACING_SM,
-                    background_color=Theme.SURFACE,
-                    color=Theme.TEXT_SECONDARY,
-                    font_size=Theme.FONT_SIZE_SM,
-                ),
-            )
-        )
-        chips.append(toga.Box(style=Pack(width=Theme.SPACING_SM)))
-
-        # +10 button
-        def on_plus_10(widget: toga.Widget) -> None:
-            if self.weight_input:
-                current = get_current_weight()
-                self.weight_input.value = str(int(current + 10))
-
-        chips.append(
-            toga.Button(
-                text="+10",
-                on_press=on_plus_10,
-                style=Pack(
-                    padding_left=Theme.SPACING_MD,
-                    padding_right=Theme.SPACING_MD,
-                    padding_top=Theme.SPACING_SM,
-                    padding_bottom=Theme.SPACING_SM,
-                    background_color=Theme.SURFACE,
-                    color=Theme.TEXT_SECONDARY,
-                    font_size=Theme.FONT_SIZE_SM,
-                ),
-            )
-        )
-        chips.append(toga.Box(style=Pack(width=Theme.SPACING_SM)))
-
-        # -5 button
-        def on_minus_5(widget: toga.Widget) -> None:
-            if self.weight_input:
-                current = get_current_weight()
-                new_val = max(0, current - 5)
-                self.weight_input.value = str(int(new_val))
-
-        chips.append(
-            toga.Button(
-                text="-5",
-                on_press=on_minus_5,
-                style=Pack(
-                    padding_left=Theme.SPACING_MD,
-                    padding_right=Theme.SPACING_MD,
-                    padding_top=Theme.SPACING_SM,
-                    padding_bottom=Theme.SPACING_SM,
-                    background_color=Theme.SURFACE,
-                    color=Theme.TEXT_SECONDARY,
-                    font_size=Theme.FONT_SIZE_SM,
-                ),
+        chips: list[toga.Widget] = []
+        for text in _WEIGHT_CHIP_TEXTS:
+            if chips:
+                chips.append(toga.Box(style=_CHIP_GAP_STYLE))
+            chips.append(
+                toga.Button(
+                    text=text,
+                    on_press=self._on_weight_chip,
+                    style=_CHIP_STYLE,
+                )
             )
-        )
 
         return toga.Box(
             children=chips,
-            style=Pack(direction=ROW),
+            style=_ROW_STYLE,
         )
 
+    def _on_weight_chip(self, widget: toga.Widget) -> None:
+        """Adjust the weight input by the signed delta in the chip text."""
+        if not self.weight_input:
+            return
+
+        current: float = self.last_weight or 0
+        if self.weight_input.value:
+            # Unparseable input falls back to the last logged weight
+            with suppress(ValueError):
+                current = float(self.weight_input.value)
+
+        self.weight_input.value = str(int(max(0, current + int(widget.text))))
+
     def _create_add_set_button(self) -> toga.Box:
         """Create the add set button."""
 
@@ -406,7 +413,7 @@ class ExerciseDetailView:
             children=[
                 primary_button("Log Set", on_press=on_add_set),
             ],
-            style=Pack(direction=ROW),
+            style=_ROW_STYLE,
         )
 
     def _add_set(self) -> None:
@@ -436,7 +443,8 @@ class ExerciseDetailView:
             reps=reps,
             weight=weight,
         )
-        self.app.session_repo.save_set(new_set)
+        self.app.session_repo.save_set_deferred(new_set)
+        self._schedule_set_flush()
 
         # Add to local list
         self.exercise.sets.append(new_set)
@@ -444,54 +452,129 @@ class ExerciseDetailView:
         # Clear reps input, keep weight
         self.reps_input.value = ""
 
-        # Refresh view
-        self.app.navigate_to_exercise(self.session_id, self.exercise_id)
+        if self.history_box is None:
+            self.app.navigate_to_exercise(self.session_id, self.exercise_id)
+            return
+
+        # Show the new set without rebuilding the whole view
+        item = self._create_set_item(len(self.exercise.sets), new_set, self._set_formatter())
+        self._history_offset += 1
+        if len(self.exercise.sets) == 1:
+            # Replace the empty state with the list header
+            with defer_layout(self.history_box) as history_box:
+                history_box.clear()
+                history_box.add(self._create_set_history_label(), item)
+        else:
+            self.history_box.insert(1, item)
+
+    def _schedule_set_flush(self) -> None:
+        """Write queued sets shortly after the last one is logged."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+
+        async def flush(app: toga.App) -> None:
+            await asyncio.sleep(_SET_FLUSH_DELAY)
+            self._flush_scheduled = False
+            try:
+                self.app.session_repo.flush_pending_sets()
+            except Exception as e:
+                # The sets stay queued and are retried by the next flush
+                await app.main_window.error_dialog(
+                    title="Sets Not Saved",
+                    message=f"Could not save your latest sets: {str(e)}",
+                )
+
+        self.app.add_background_task(flush)
 
     def _create_set_history(self) -> toga.Box:
         """Create the set history list (most recent first)."""
         if not self.exercise or not self.exercise.sets:
-            return toga.Box(
-                children=[
-                    toga.Label(
-                        text="No sets logged yet",
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_SM,
-                            color=Theme.TEXT_TERTIARY,
-                            text_align=CENTER,
+            children = [
+                toga.Box(
+                    children=[
+                        toga.Label(
+                            text="No sets logged yet",
+                            style=_EMPTY_HISTORY_LABEL_STYLE,
                         ),
-                    ),
-                ],
-                style=Pack(direction=COLUMN, alignment=CENTER),
-            )
-
-        children = [
-            toga.Label(
-                text="Sets",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_bottom=Theme.SPACING_SM,
+                    ],
+                    style=_EMPTY_HISTORY_STYLE,
                 ),
-            ),
+            ]
+        else:
+            # Show the newest page of sets; older ones load on demand
+            self._history_offset = 0
+            children = [self._create_set_history_label(), *self._create_set_page()]
+            if self._history_offset < len(self.exercise.sets):
+                children.append(self._create_show_older_button())
+
+        self.history_box = toga.Box(
+            children=children,
+            style=_COLUMN_STYLE,
+        )
+        return self.history_box
+
+    def _create_set_page(self) -> list[toga.Box]:
+        """Create items for the next page of older sets and advance the offset."""
+        if not self.exercise:
+            return []
+
+        sets = self.exercise.sets
+        total = len(sets)
+        start = self._history_offset
+        end = min(start + Theme.HISTORY_PAGE_SIZE, total)
+        self._history_offset = end
+
+        # Pair each set in the page, newest first, with its set number
+        fmt = self._set_formatter()
+        set_nums = range(total - start, total - end, -1)
+        page = reversed(sets[total - end : total - start])
+        return [
+            self._create_set_item(set_num, workout_set, fmt)
+            for set_num, workout_set in zip(set_nums, page, strict=True)
         ]
 
-        # Show sets in reverse order (newest first)
-        for i, workout_set in enumerate(reversed(self.exercise.sets)):
-            set_num = len(self.exercise.sets) - i
-            children.append(self._create_set_item(set_num, workout_set))
+    def _set_formatter(self) -> Callable[[Set], str]:
+        """Get the set text formatter for this exercise."""
+        return partial(format_set, uses_weight=bool(self.exercise and self.exercise.uses_weight))
 
-        return toga.Box(
-            children=children,
-            style=Pack(direction=COLUMN),
+    def _create_show_older_button(self) -> toga.Box:
+        """Create the button that loads the next page of older sets."""
+
+        def on_show_older(widget: toga.Widget) -> None:
+            if not self.exercise or not self.history_box:
+                return
+
+            # Insert the page just above this button
+            with defer_layout(self.history_box) as history_box:
+                index = len(history_box.children) - 1
+                for item in self._create_set_page():
+                    history_box.insert(index, item)
+                    index += 1
+
+                if self._history_offset >= len(self.exercise.sets):
+                    history_box.remove(container)
+
+        container = toga.Box(
+            children=[secondary_button("Show older sets", on_press=on_show_older)],
+            style=_SHOW_OLDER_STYLE,
         )
+        return container
 
-    def _create_set_item(self, set_num: int, workout_set: Set) -> toga.Box:
+    def _create_set_history_label(self) -> toga.Label:
+        """Create the heading of the set history list."""
+        return toga.Label(
+            text="Sets",
+            style=_HISTORY_LABEL_STYLE,
+        )
+
+    def _create_set_item(
+        self,
+        set_num: int,
+        workout_set: Set,
+        fmt: Callable[[Set], str],
+    ) -> toga.Box:
         """Create a single set history item."""
-        # Format set info
-        if self.exercise and self.exercise.uses_weight and workout_set.weight:
-            set_text = f"{int(workout_set.weight)} × {workout_set.reps}"
-        else:
-            set_text = f"{workout_set.reps} reps"
 
         def on_delete(widget: toga.Widget) -> None:
             async def confirm_delete(dialog_app: toga.App) -> None:
@@ -509,38 +592,19 @@ class ExerciseDetailView:
             children=[
                 toga.Label(
                     text=f"Set {set_num}",
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_SM,
-                        color=Theme.TEXT_SECONDARY,
-                        width=60,
-                    ),
+                    style=_SET_NUMBER_STYLE,
                 ),
                 toga.Label(
-                    text=set_text,
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_BASE,
-                        color=Theme.TEXT_PRIMARY,
-                        flex=1,
-                    ),
+                    text=fmt(workout_set),
+                    style=_SET_TEXT_STYLE,
                 ),
                 toga.Button(
                     text="×",
                     on_press=on_delete,
-                    style=Pack(
-                        padding=Theme.SPACING_XS,
-                        background_color=Theme.SURFACE,
-                        color=Theme.TEXT_TERTIARY,
-                        font_size=Theme.FONT_SIZE_BASE,
-                        width=30,
-                    ),
+                    style=_SET_DELETE_STYLE,
                 ),
             ],
-            style=Pack(
-                direction=ROW,
-                padding=Theme.SPACING_SM,
-                background_color=Theme.SURFACE,
-                alignment=CENTER,
-            ),
+            style=_SET_ROW_STYLE,
         )
 
 
@@ -2,6 +2,7 @@
 
 import csv
 import json
+import re
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
@@ -9,23 +10,39 @@ from typing import Any
 
 from app.core.models import WorkoutSession
 
+# Anything other than letters, digits, spaces, hyphens and underscores
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup, absent on mobile builds
+    _HAS_ORJSON = False
+
+_CSV_HEADER = ("exercise", "set_number", "reps", "weight", "created_at")
+
 
 def session_to_dict(session: WorkoutSession) -> dict[str, Any]:
     """
     Convert a workout session to a dictionary for JSON export.
 
+    Timestamps are left as datetime objects; the JSON exporters write
+    them as ISO 8601 strings.
+
     Args:
         session: The workout session to convert
 
     Returns:
         Dictionary representation of the session
     """
+    total_sets, total_reps, total_volume = session.compute_stats()
     return {
         "session_id": str(session.id),
         "template_id": str(session.template_id) if session.template_id else None,
         "template_name": session.template_name,
-        "started_at": session.started_at.isoformat(),
-        "ended_at": session.ended_at.isoformat() if session.ended_at else None,
+        "started_at": session.started_at,
+        "ended_at": session.ended_at,
         "duration_seconds": session.duration_seconds,
         "notes": session.notes,
         "exercises": [
@@ -37,7 +54,7 @@ def session_to_dict(session: WorkoutSession) -> dict[str, Any]:
                     {
                         "reps": s.reps,
                         "weight": s.weight,
-                        "created_at": s.created_at.isoformat(),
+                        "created_at": s.created_at,
                     }
                     for s in ex.sets
                 ],
@@ -46,13 +63,20 @@ def session_to_dict(session: WorkoutSession) -> dict[str, Any]:
         ],
         "summary": {
             "total_exercises": len(session.exercises),
-            "total_sets": session.total_sets,
-            "total_reps": session.total_reps,
-            "total_volume": session.total_volume,
+            "total_sets": total_sets,
+            "total_reps": total_reps,
+            "total_volume": total_volume,
         },
     }
 
 
+def _json_default(value: Any) -> str:
+    """Encode values the json module can't, matching orjson's output."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def export_session_json(session: WorkoutSession, filepath: Path) -> Path:
     """
     Export a workout session to JSON file.
@@ -66,8 +90,12 @@ def export_session_json(session: WorkoutSession, filepath: Path) -> Path:
     """
     data = session_to_dict(session)
 
+    if _HAS_ORJSON:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return filepath
+
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
 
     return filepath
 
@@ -83,7 +111,31 @@ def export_session_json_string(session: WorkoutSession) -> str:
         JSON string representation
     """
     data = session_to_dict(session)
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def _write_session_csv(session: WorkoutSession, writer: Any) -> None:
+    """
+    Write the CSV header followed by one row per set.
+
+    Args:
+        session: The workout session to export
+        writer: csv.writer to write the rows to
+    """
+    writer.writerow(_CSV_HEADER)
+    writer.writerows(
+        [
+            exercise.name,
+            set_num,
+            s.reps,
+            s.weight if s.weight is not None else "",
+            s.created_at.isoformat(),
+        ]
+        for exercise in session.exercises
+        for set_num, s in enumerate(exercise.sets, start=1)
+    )
 
 
 def export_session_csv(session: WorkoutSession, filepath: Path) -> Path:
@@ -101,23 +153,7 @@ def export_session_csv(session: WorkoutSession, filepath: Path) -> Path:
         Path to the saved file
     """
     with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-
-        # Write header
-        writer.writerow(["exercise", "set_number", "reps", "weight", "created_at"])
-
-        # Write sets
-        for exercise in session.exercises:
-            for set_num, s in enumerate(exercise.sets, start=1):
-                writer.writerow(
-                    [
-                        exercise.name,
-                        set_num,
-                        s.reps,
-                        s.weight if s.weight is not None else "",
-                        s.created_at.isoformat(),
-                    ]
-                )
+        _write_session_csv(session, csv.writer(f))
 
     return filepath
 
@@ -126,6 +162,9 @@ def export_session_csv_string(session: WorkoutSession) -> str:
     """
     Export a workout session to CSV string.
 
+    Rows are separated by plain newlines rather than the CRLF used for
+    files.
+
     Args:
         session: The workout session to export
 
@@ -133,24 +172,7 @@ def export_session_csv_string(session: WorkoutSession) -> str:
         CSV string representation
     """
     output = StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow(["exercise", "set_number", "reps", "weight", "created_at"])
-
-    # Write sets
-    for exercise in session.exercises:
-        for set_num, s in enumerate(exercise.sets, start=1):
-            writer.writerow(
-                [
-                    exercise.name,
-                    set_num,
-                    s.reps,
-                    s.weight if s.weight is not None else "",
-                    s.created_at.isoformat(),
-                ]
-            )
-
+    _write_session_csv(session, csv.writer(output, lineterminator="\n"))
     return output.getvalue()
 
 
@@ -171,6 +193,5 @@ def generate_export_filename(
     date_str = session.started_at.strftime("%Y-%m-%d")
     name = session.template_name or "Workout"
     # Clean the name for use in filename
-    safe_name = "".join(c if c.isalnum() or c in " -_" else "" for c in name)
-    safe_name = safe_name.replace(" ", "_")
+    safe_name = _UNSAFE_FILENAME_CHARS.sub("", name).replace(" ", "_")
     return f"ironlog_{safe_name}_{date_str}.{extension}"
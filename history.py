@@ -1,5 +1,6 @@
 """History tab - View past workout sessions."""
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
@@ -7,13 +8,22 @@ import toga
 from toga.style import Pack
 from toga.style.pack import BOLD, CENTER, COLUMN, ROW
 
-from app.core.models import WorkoutSession, format_date, format_datetime, format_weight
+from app.core.models import (
+    SessionSummary,
+    WorkoutSession,
+    format_date_batch,
+    format_datetime,
+    format_set,
+)
 from app.ui.components import (
+    defer_layout,
     empty_state,
     flex_spacer,
     screen_container,
+    secondary_button,
     secondary_text,
     spacer,
+    surface_card_button,
     title_text,
 )
 from app.ui.theme import Theme
@@ -22,12 +32,91 @@ if TYPE_CHECKING:
     from app.main import IronLogApp
 
 
+# Layout
+_COLUMN_STYLE = Pack(direction=COLUMN)
+_ROW_STYLE = Pack(direction=ROW)
+_HEADER_STYLE = Pack(direction=ROW, padding_bottom=Theme.SPACING_LG)
+
+# Session list
+_FIRST_DATE_HEADER_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_TERTIARY,
+    padding_top=0,
+    padding_bottom=Theme.SPACING_SM,
+)
+_DATE_HEADER_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_TERTIARY,
+    padding_top=Theme.SPACING_LG,
+    padding_bottom=Theme.SPACING_SM,
+)
+_SHOW_OLDER_STYLE = Pack(direction=ROW, padding_top=Theme.SPACING_SM)
+
+# Session detail
+_NOT_FOUND_STYLE = Pack(color=Theme.TEXT_TERTIARY)
+_BACK_BUTTON_STYLE = Pack(
+    padding=Theme.SPACING_SM,
+    background_color=Theme.BACKGROUND,
+    color=Theme.PRIMARY,
+    font_size=Theme.FONT_SIZE_BASE,
+)
+_TITLE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_2XL,
+    font_weight=BOLD,
+    color=Theme.TEXT_PRIMARY,
+    padding_bottom=Theme.SPACING_XS,
+)
+_SUBTITLE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_bottom=Theme.SPACING_LG,
+)
+_SECTION_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_bottom=Theme.SPACING_SM,
+)
+
+# Summary stats
+_SUMMARY_STYLE = Pack(direction=ROW, padding=Theme.SPACING_BASE, background_color=Theme.SURFACE)
+_STAT_ITEM_STYLE = Pack(direction=COLUMN, flex=1, alignment=CENTER)
+_STAT_VALUE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_XL,
+    font_weight=BOLD,
+    color=Theme.TEXT_PRIMARY,
+    text_align=CENTER,
+)
+_STAT_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_XS,
+    color=Theme.TEXT_SECONDARY,
+    text_align=CENTER,
+)
+
+# Exercise sections
+_EXERCISE_SECTION_STYLE = Pack(
+    direction=COLUMN,
+    padding=Theme.SPACING_BASE,
+    background_color=Theme.SURFACE,
+)
+_EXERCISE_NAME_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_BASE,
+    font_weight=BOLD,
+    color=Theme.TEXT_PRIMARY,
+    padding_bottom=Theme.SPACING_SM,
+)
+# One multi-line label lists all sets of an exercise
+_SET_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_left=Theme.SPACING_SM,
+    padding_bottom=Theme.SPACING_XS,
+)
+
+
 def create_history_tab(app: "IronLogApp") -> toga.Box:
     """Create the History tab content."""
-    sessions = app.session_repo.get_all(limit=50)
-
-    # Filter to only completed sessions
-    completed_sessions = [s for s in sessions if s.ended_at is not None]
+    # One more than a page, to tell whether older sessions exist
+    completed_sessions = app.session_repo.get_completed(limit=Theme.SESSION_PAGE_SIZE + 1)
 
     children = [
         # Header
@@ -35,32 +124,12 @@ def create_history_tab(app: "IronLogApp") -> toga.Box:
             children=[
                 title_text("History"),
             ],
-            style=Pack(direction=ROW, padding_bottom=Theme.SPACING_LG),
+            style=_HEADER_STYLE,
         ),
     ]
 
     if completed_sessions:
-        # Group sessions by date
-        current_date = None
-        for session in completed_sessions:
-            session_date = format_date(session.started_at)
-
-            if session_date != current_date:
-                current_date = session_date
-                children.append(
-                    toga.Label(
-                        text=session_date,
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_SM,
-                            color=Theme.TEXT_TERTIARY,
-                            padding_top=Theme.SPACING_LG if len(children) > 1 else 0,
-                            padding_bottom=Theme.SPACING_SM,
-                        ),
-                    )
-                )
-
-            children.append(_create_session_card(app, session))
-            children.append(spacer(Theme.SPACING_SM))
+        children.append(SessionHistoryList(app, completed_sessions).create_view())
     else:
         children.append(
             empty_state(
@@ -74,35 +143,114 @@ def create_history_tab(app: "IronLogApp") -> toga.Box:
     return screen_container(children)
 
 
-def _create_session_card(app: "IronLogApp", session: WorkoutSession) -> toga.Box:
+class SessionHistoryList:
+    """
+    Session cards of the History tab, grouped by date.
+
+    Only the newest page of sessions is loaded and built up front; older
+    pages are fetched and added below it on demand, so opening the tab
+    costs the same however long the history is.
+    """
+
+    def __init__(self, app: "IronLogApp", sessions: list[SessionSummary]) -> None:
+        self.app = app
+        # Newest completed sessions, up to one more than a page
+        self.sessions = sessions
+
+        # Container the pages are added to
+        self.box: Optional[toga.Box] = None
+        # (started_at, id) of the oldest session shown; older pages start below it
+        self._cursor: Optional[tuple[datetime, UUID]] = None
+        # Whether sessions older than the cursor exist
+        self._has_more = False
+        # Date heading of the last card shown
+        self._current_date: Optional[str] = None
+
+    def create_view(self) -> toga.Box:
+        """Create the list with its first page of cards."""
+        self._current_date = None
+
+        children = self._create_page(self.sessions)
+        if self._has_more:
+            children.append(self._create_show_older_button())
+
+        self.box = toga.Box(children=children, style=_COLUMN_STYLE)
+        return self.box
+
+    def _create_page(self, sessions: list[SessionSummary]) -> list[toga.Widget]:
+        """
+        Create the widgets for a page of sessions and advance the cursor.
+
+        Args:
+            sessions: Sessions after the cursor, newest first; one more
+                than a page means further pages exist
+
+        Returns:
+            Widgets for at most one page of sessions
+        """
+        page = sessions[: Theme.SESSION_PAGE_SIZE]
+        self._has_more = len(sessions) > len(page)
+        if page:
+            self._cursor = (page[-1].started_at, page[-1].id)
+
+        children: list[toga.Widget] = []
+        session_dates = format_date_batch([session.started_at for session in page])
+        for session, session_date in zip(page, session_dates, strict=True):
+            if session_date != self._current_date:
+                # Only headings below an earlier card get top padding
+                style = _DATE_HEADER_STYLE if self._current_date else _FIRST_DATE_HEADER_STYLE
+                children.append(toga.Label(text=session_date, style=style))
+                self._current_date = session_date
+
+            children.extend((_create_session_card(self.app, session), spacer(Theme.SPACING_SM)))
+
+        return children
+
+    def _create_show_older_button(self) -> toga.Box:
+        """Create the button that loads the next page of older sessions."""
+
+        def on_show_older(widget: toga.Widget) -> None:
+            if not self.box:
+                return
+
+            sessions = self.app.session_repo.get_completed(
+                limit=Theme.SESSION_PAGE_SIZE + 1,
+                before=self._cursor,
+            )
+
+            # Insert the page just above this button
+            with defer_layout(self.box) as box:
+                index = len(box.children) - 1
+                for item in self._create_page(sessions):
+                    box.insert(index, item)
+                    index += 1
+
+                if not self._has_more:
+                    box.remove(container)
+
+        container = toga.Box(
+            children=[secondary_button("Show older sessions", on_press=on_show_older)],
+            style=_SHOW_OLDER_STYLE,
+        )
+        return container
+
+
+def _create_session_card(app: "IronLogApp", session: SessionSummary) -> toga.Box:
     """Create a session history card."""
 
     def on_press(widget: toga.Widget) -> None:
         app.navigate_to_session_detail(session.id)
 
-    name = session.template_name or "Custom Workout"
-    duration = session.formatted_duration()
-
-    # Summary stats
-    exercise_count = len(session.exercises)
-    set_count = session.total_sets
-
     return toga.Box(
         children=[
-            toga.Button(
-                text=f"{name}\n{duration} · {exercise_count} exercises · {set_count} sets",
+            surface_card_button(
+                f"{session.template_name or 'Custom Workout'}\n"
+                f"{session.formatted_duration()} · "
+                f"{session.exercise_count} exercises · {session.total_sets} sets",
                 on_press=on_press,
-                style=Pack(
-                    padding=Theme.SPACING_BASE,
-                    background_color=Theme.SURFACE,
-                    color=Theme.TEXT_PRIMARY,
-                    font_size=Theme.FONT_SIZE_BASE,
-                    flex=1,
-                    text_align=CENTER,
-                ),
             ),
         ],
-        style=Pack(direction=ROW),
+        style=_ROW_STYLE,
     )
 
 
@@ -119,17 +267,19 @@ class SessionDetailView:
 
     def refresh_session(self) -> None:
         """Reload session from database."""
-        self.session = self.app.session_repo.get_by_id(self.session_id)
+        self.session = self.app.session_repo.get_by_id_full(self.session_id)
 
     def create_view(self) -> toga.Box:
         """Create the session detail view."""
         if not self.session:
-            return screen_container([
-                toga.Label(
-                    text="Session not found",
-                    style=Pack(color=Theme.TEXT_TERTIARY),
-                )
-            ])
+            return screen_container(
+                [
+                    toga.Label(
+                        text="Session not found",
+                        style=_NOT_FOUND_STYLE,
+                    )
+                ]
+            )
 
         children = []
 
@@ -141,12 +291,7 @@ class SessionDetailView:
         children.append(
             toga.Label(
                 text=name,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_2XL,
-                    font_weight=BOLD,
-                    color=Theme.TEXT_PRIMARY,
-                    padding_bottom=Theme.SPACING_XS,
-                ),
+                style=_TITLE_STYLE,
             )
         )
 
@@ -156,33 +301,23 @@ class SessionDetailView:
         children.append(
             toga.Label(
                 text=f"{date_str}  ·  {duration}",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_bottom=Theme.SPACING_LG,
-                ),
+                style=_SUBTITLE_STYLE,
             )
         )
 
         # Summary stats
-        children.append(self._create_summary())
-        children.append(spacer(Theme.SPACING_XL))
+        children.extend((self._create_summary(), spacer(Theme.SPACING_XL)))
 
         # Exercise list
         children.append(
             toga.Label(
                 text="Exercises",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_bottom=Theme.SPACING_SM,
-                ),
+                style=_SECTION_LABEL_STYLE,
             )
         )
 
         for exercise in self.session.exercises:
-            children.append(self._create_exercise_section(exercise))
-            children.append(spacer(Theme.SPACING_MD))
+            children.extend((self._create_exercise_section(exercise), spacer(Theme.SPACING_MD)))
 
         children.append(flex_spacer())
 
@@ -199,19 +334,11 @@ class SessionDetailView:
                 toga.Button(
                     text="← History",
                     on_press=on_back,
-                    style=Pack(
-                        padding=Theme.SPACING_SM,
-                        background_color=Theme.BACKGROUND,
-                        color=Theme.PRIMARY,
-                        font_size=Theme.FONT_SIZE_BASE,
-                    ),
+                    style=_BACK_BUTTON_STYLE,
                 ),
                 flex_spacer(),
             ],
-            style=Pack(
-                direction=ROW,
-                padding_bottom=Theme.SPACING_LG,
-            ),
+            style=_HEADER_STYLE,
         )
 
     def _create_summary(self) -> toga.Box:
@@ -219,18 +346,15 @@ class SessionDetailView:
         if not self.session:
             return toga.Box()
 
+        total_sets, total_reps, total_volume = self.session.compute_stats()
         return toga.Box(
             children=[
                 self._stat_item(str(len(self.session.exercises)), "Exercises"),
-                self._stat_item(str(self.session.total_sets), "Sets"),
-                self._stat_item(str(self.session.total_reps), "Reps"),
-                self._stat_item(f"{int(self.session.total_volume)}", "Volume"),
+                self._stat_item(str(total_sets), "Sets"),
+                self._stat_item(str(total_reps), "Reps"),
+                self._stat_item(f"{int(total_volume)}", "Volume"),
             ],
-            style=Pack(
-                direction=ROW,
-                padding=Theme.SPACING_BASE,
-                background_color=Theme.SURFACE,
-            ),
+            style=_SUMMARY_STYLE,
         )
 
     def _stat_item(self, value: str, label: str) -> toga.Box:
@@ -239,70 +363,41 @@ class SessionDetailView:
             children=[
                 toga.Label(
                     text=value,
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_XL,
-                        font_weight=BOLD,
-                        color=Theme.TEXT_PRIMARY,
-                        text_align=CENTER,
-                    ),
+                    style=_STAT_VALUE_STYLE,
                 ),
                 toga.Label(
                     text=label,
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_XS,
-                        color=Theme.TEXT_SECONDARY,
-                        text_align=CENTER,
-                    ),
+                    style=_STAT_LABEL_STYLE,
                 ),
             ],
-            style=Pack(
-                direction=COLUMN,
-                flex=1,
-                alignment=CENTER,
-            ),
+            style=_STAT_ITEM_STYLE,
         )
 
     def _create_exercise_section(self, exercise) -> toga.Box:  # noqa: ANN001
         """Create an exercise section with its sets."""
+        lines = [
+            f"Set {set_num}: {format_set(workout_set, exercise.uses_weight)}"
+            for set_num, workout_set in enumerate(exercise.sets, 1)
+        ]
+
         children = [
             toga.Label(
                 text=exercise.name,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_BASE,
-                    font_weight=BOLD,
-                    color=Theme.TEXT_PRIMARY,
-                    padding_bottom=Theme.SPACING_SM,
-                ),
+                style=_EXERCISE_NAME_STYLE,
             ),
         ]
-
-        # List sets
-        for i, workout_set in enumerate(exercise.sets):
-            set_num = i + 1
-            if exercise.uses_weight and workout_set.weight:
-                set_text = f"Set {set_num}: {int(workout_set.weight)} × {workout_set.reps}"
-            else:
-                set_text = f"Set {set_num}: {workout_set.reps} reps"
-
+        # List sets in a single label rather than one widget per set
+        if lines:
             children.append(
                 toga.Label(
-                    text=set_text,
-                    style=Pack(
-                        font_size=Theme.FONT_SIZE_SM,
-                        color=Theme.TEXT_SECONDARY,
-                        padding_left=Theme.SPACING_SM,
-                        padding_bottom=Theme.SPACING_XS,
-                    ),
+                    text="\n".join(lines),
+                    style=_SET_LABEL_STYLE,
                 )
             )
 
         return toga.Box(
             children=children,
-            style=Pack(
-                direction=COLUMN,
-                padding=Theme.SPACING_BASE,
-                background_color=Theme.SURFACE,
-            ),
+            style=_EXERCISE_SECTION_STYLE,
         )
 
 
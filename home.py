@@ -1,5 +1,7 @@
 """Home tab - Quick start workout."""
 
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
@@ -7,7 +9,7 @@ import toga
 from toga.style import Pack
 from toga.style.pack import BOLD, CENTER, COLUMN, ROW
 
-from app.core.models import WorkoutSession, WorkoutTemplate
+from app.core.models import SessionSummary, WorkoutSession, WorkoutTemplate
 from app.ui.components import (
     body_text,
     card,
@@ -18,6 +20,7 @@ from app.ui.components import (
     secondary_button,
     secondary_text,
     spacer,
+    surface_card_button,
     title_text,
 )
 from app.ui.theme import Theme
@@ -26,19 +29,155 @@ if TYPE_CHECKING:
     from app.main import IronLogApp
 
 
-def create_home_tab(app: "IronLogApp") -> toga.Box:
-    """Create the Home tab content."""
-    # Check for active session
-    active_session = app.session_repo.get_active()
+# Layout
+_COLUMN_STYLE = Pack(direction=COLUMN)
+_ROW_STYLE = Pack(direction=ROW)
+_HEADER_STYLE = Pack(direction=COLUMN, padding_bottom=Theme.SPACING_2XL)
+_SECTION_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_SECONDARY,
+    padding_bottom=Theme.SPACING_SM,
+)
+
+# Active session card
+_ACTIVE_CARD_STYLE = Pack(
+    direction=COLUMN,
+    padding=Theme.CARD_PADDING,
+    background_color=Theme.SURFACE,
+)
+_ACTIVE_BADGE_STYLE = Pack(font_size=Theme.FONT_SIZE_SM, color=Theme.WARNING, font_weight=BOLD)
+_ACTIVE_TITLE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_XL,
+    color=Theme.TEXT_PRIMARY,
+    font_weight=BOLD,
+)
+_ACTIVE_DETAIL_STYLE = Pack(font_size=Theme.FONT_SIZE_SM, color=Theme.TEXT_SECONDARY)
+_DISCARD_BUTTON_STYLE = Pack(
+    padding=Theme.SPACING_SM,
+    background_color=Theme.SURFACE,
+    color=Theme.DANGER,
+    font_size=Theme.FONT_SIZE_SM,
+)
 
-    # Get templates for selection
-    templates = app.template_repo.get_all()
+# Quick start templates
+_TEMPLATE_ROW_STYLE = Pack(direction=ROW, padding_bottom=Theme.SPACING_SM)
+_NO_TEMPLATES_STYLE = Pack(direction=COLUMN, alignment=CENTER, padding=Theme.SPACING_LG)
+_NO_TEMPLATES_TITLE_STYLE = Pack(font_size=Theme.FONT_SIZE_SM, color=Theme.TEXT_TERTIARY)
+_NO_TEMPLATES_HINT_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_XS,
+    color=Theme.TEXT_TERTIARY,
+    padding_top=Theme.SPACING_XS,
+)
+
+# Recent stats
+_STATS_STYLE = Pack(direction=COLUMN, padding=Theme.SPACING_BASE, background_color=Theme.SURFACE)
+_STATS_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_SM,
+    color=Theme.TEXT_TERTIARY,
+    padding_bottom=Theme.SPACING_SM,
+)
+_STAT_ITEM_STYLE = Pack(direction=COLUMN, flex=1, alignment=CENTER)
+_STAT_VALUE_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_2XL,
+    font_weight=BOLD,
+    color=Theme.TEXT_PRIMARY,
+    text_align=CENTER,
+)
+_STAT_LABEL_STYLE = Pack(
+    font_size=Theme.FONT_SIZE_XS,
+    color=Theme.TEXT_SECONDARY,
+    text_align=CENTER,
+)
+
+
+@dataclass
+class HomeSnapshot:
+    """The data shown on the Home tab, with the repository versions it was read at."""
+
+    session_key: tuple[int, date]
+    template_version: int
+    state_version: int
+    active_session: Optional[WorkoutSession]
+    # None until _load_week_stats has run for this session data
+    week_sessions: Optional[list[SessionSummary]]
+    has_history: bool
+    templates: list[WorkoutTemplate]
+    last_template: Optional[WorkoutTemplate]
+
+
+def _load_home_snapshot(app: "IronLogApp") -> HomeSnapshot:
+    """
+    Get the Home tab data, re-querying only the parts whose repository changed.
+
+    Args:
+        app: The app whose repositories and cached snapshot are used.
+
+    Returns:
+        The up-to-date snapshot, also stored on the app for the next render.
+    """
+    snapshot = app._home_snapshot
+    # The week window moves with the date, so session data is keyed on both
+    session_key = (app.session_repo.version, date.today())
+    template_version = app.template_repo.version
+    state_version = app.state_repo.version
+
+    if snapshot is None or snapshot.session_key != session_key:
+        active_session = app.session_repo.get_active()
+        week_sessions = None
+        has_history = False
+    else:
+        active_session = snapshot.active_session
+        week_sessions = snapshot.week_sessions
+        has_history = snapshot.has_history
+
+    if snapshot is None or snapshot.template_version != template_version:
+        templates = app.template_repo.get_all()
+    else:
+        templates = snapshot.templates
+
+    if (
+        snapshot is None
+        or snapshot.template_version != template_version
+        or snapshot.state_version != state_version
+    ):
+        last_template_id = app.state_repo.get_last_template_id()
+        last_template = next((t for t in templates if t.id == last_template_id), None)
+    else:
+        last_template = snapshot.last_template
+
+    snapshot = HomeSnapshot(
+        session_key=session_key,
+        template_version=template_version,
+        state_version=state_version,
+        active_session=active_session,
+        week_sessions=week_sessions,
+        has_history=has_history,
+        templates=templates,
+        last_template=last_template,
+    )
+    app._home_snapshot = snapshot
+    return snapshot
 
-    # Get last used template
-    last_template_id = app.state_repo.get_last_template_id()
-    last_template: Optional[WorkoutTemplate] = None
-    if last_template_id:
-        last_template = app.template_repo.get_by_id(last_template_id)
+
+def _load_week_stats(app: "IronLogApp", snapshot: HomeSnapshot) -> list[SessionSummary]:
+    """
+    Fill in the snapshot's sessions of the past week and history flag.
+
+    Returns:
+        The sessions of the past week, as stored on the snapshot
+    """
+    week_sessions = app.session_repo.get_since(datetime.now() - timedelta(days=7))
+    snapshot.has_history = bool(week_sessions or app.session_repo.get_all(limit=1))
+    snapshot.week_sessions = week_sessions
+    return week_sessions
+
+
+def create_home_tab(app: "IronLogApp") -> toga.Box:
+    """Create the Home tab content."""
+    snapshot = _load_home_snapshot(app)
+    active_session = snapshot.active_session
+    templates = snapshot.templates
+    last_template = snapshot.last_template
 
     # Build content
     children = [
@@ -48,7 +187,7 @@ def create_home_tab(app: "IronLogApp") -> toga.Box:
                 title_text("IronLog", size=Theme.FONT_SIZE_3XL),
                 secondary_text("Track your workouts"),
             ],
-            style=Pack(direction=COLUMN, padding_bottom=Theme.SPACING_2XL),
+            style=_HEADER_STYLE,
         ),
     ]
 
@@ -63,9 +202,25 @@ def create_home_tab(app: "IronLogApp") -> toga.Box:
     children.append(flex_spacer())
 
     # Stats summary (if any history exists)
-    sessions = app.session_repo.get_all(limit=7)
-    if sessions:
-        children.append(_recent_stats(sessions))
+    stats_box = toga.Box(style=_COLUMN_STYLE)
+    children.append(stats_box)
+    if snapshot.week_sessions is None:
+        # Query the stats after the tab has been shown, not before
+        async def fill_stats(dialog_app: toga.App) -> None:
+            """
+            Add the stats once the tab is on screen.
+
+            The queries still run synchronously inside this coroutine, so
+            they block the event loop while they run; deferring them only
+            lets the tab appear first.
+            """
+            week_sessions = _load_week_stats(app, snapshot)
+            if snapshot.has_history:
+                stats_box.add(_recent_stats(week_sessions))
+
+        app.add_background_task(fill_stats)
+    elif snapshot.has_history:
+        stats_box.add(_recent_stats(snapshot.week_sessions))
 
     return screen_container(children)
 
@@ -100,31 +255,20 @@ def _active_session_card(app: "IronLogApp", session: WorkoutSession) -> toga.Box
                 children=[
                     toga.Label(
                         text="🔥 Active Workout",
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_SM,
-                            color=Theme.WARNING,
-                            font_weight=BOLD,
-                        ),
+                        style=_ACTIVE_BADGE_STYLE,
                     ),
                     spacer(Theme.SPACING_SM),
                     toga.Label(
                         text=template_name,
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_XL,
-                            color=Theme.TEXT_PRIMARY,
-                            font_weight=BOLD,
-                        ),
+                        style=_ACTIVE_TITLE_STYLE,
                     ),
                     spacer(Theme.SPACING_XS),
                     toga.Label(
                         text=f"{exercise_count} exercises · {set_count} sets logged",
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_SM,
-                            color=Theme.TEXT_SECONDARY,
-                        ),
+                        style=_ACTIVE_DETAIL_STYLE,
                     ),
                 ],
-                style=Pack(direction=COLUMN),
+                style=_COLUMN_STYLE,
             ),
             spacer(Theme.SPACING_LG),
             primary_button("Continue Workout", on_press=on_continue),
@@ -132,19 +276,10 @@ def _active_session_card(app: "IronLogApp", session: WorkoutSession) -> toga.Box
             toga.Button(
                 text="Discard",
                 on_press=on_discard,
-                style=Pack(
-                    padding=Theme.SPACING_SM,
-                    background_color=Theme.SURFACE,
-                    color=Theme.DANGER,
-                    font_size=Theme.FONT_SIZE_SM,
-                ),
+                style=_DISCARD_BUTTON_STYLE,
             ),
         ],
-        style=Pack(
-            direction=COLUMN,
-            padding=Theme.CARD_PADDING,
-            background_color=Theme.SURFACE,
-        ),
+        style=_ACTIVE_CARD_STYLE,
     )
 
 
@@ -169,12 +304,8 @@ def _quick_start_section(
         # Add exercises from template
         from app.core.models import SessionExercise
 
-        for tex in template.exercises:
-            ex = SessionExercise.from_template_exercise(session.id, tex)
-            session.exercises.append(ex)
-            app.session_repo.save_exercise(ex)
-
-        app.session_repo.save(session)
+        session.exercises = SessionExercise.from_template_exercises(session.id, template.exercises)
+        app.session_repo.save_with_exercises(session)
         app.state_repo.set_active_session_id(session.id)
         app.state_repo.set_last_template_id(template.id)
         app.navigate_to_session(session.id)
@@ -187,7 +318,7 @@ def _quick_start_section(
             children=[
                 primary_button("Start Empty Workout", on_press=start_empty_workout),
             ],
-            style=Pack(direction=COLUMN),
+            style=_COLUMN_STYLE,
         )
     )
 
@@ -198,11 +329,7 @@ def _quick_start_section(
         children.append(
             toga.Label(
                 text="Quick Start",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_bottom=Theme.SPACING_SM,
-                ),
+                style=_SECTION_LABEL_STYLE,
             )
         )
 
@@ -217,7 +344,7 @@ def _quick_start_section(
                         on_press=on_last_template,
                     ),
                 ],
-                style=Pack(direction=COLUMN),
+                style=_COLUMN_STYLE,
             )
         )
         children.append(spacer(Theme.SPACING_LG))
@@ -227,11 +354,7 @@ def _quick_start_section(
         children.append(
             toga.Label(
                 text="Choose Template",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_SECONDARY,
-                    padding_bottom=Theme.SPACING_SM,
-                ),
+                style=_SECTION_LABEL_STYLE,
             )
         )
 
@@ -243,20 +366,13 @@ def _quick_start_section(
             children.append(
                 toga.Box(
                     children=[
-                        toga.Button(
-                            text=template.name,
+                        surface_card_button(
+                            template.name,
                             on_press=on_template_press,
-                            style=Pack(
-                                padding=Theme.SPACING_MD,
-                                background_color=Theme.SURFACE,
-                                color=Theme.TEXT_PRIMARY,
-                                font_size=Theme.FONT_SIZE_BASE,
-                                flex=1,
-                                text_align=CENTER,
-                            ),
+                            compact=True,
                         ),
                     ],
-                    style=Pack(direction=ROW, padding_bottom=Theme.SPACING_SM),
+                    style=_TEMPLATE_ROW_STYLE,
                 )
             )
     else:
@@ -266,54 +382,35 @@ def _quick_start_section(
                 children=[
                     toga.Label(
                         text="No templates yet",
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_SM,
-                            color=Theme.TEXT_TERTIARY,
-                        ),
+                        style=_NO_TEMPLATES_TITLE_STYLE,
                     ),
                     toga.Label(
                         text="Create templates in the Templates tab",
-                        style=Pack(
-                            font_size=Theme.FONT_SIZE_XS,
-                            color=Theme.TEXT_TERTIARY,
-                            padding_top=Theme.SPACING_XS,
-                        ),
+                        style=_NO_TEMPLATES_HINT_STYLE,
                     ),
                 ],
-                style=Pack(
-                    direction=COLUMN,
-                    alignment=CENTER,
-                    padding=Theme.SPACING_LG,
-                ),
+                style=_NO_TEMPLATES_STYLE,
             )
         )
 
     return toga.Box(
         children=children,
-        style=Pack(direction=COLUMN),
+        style=_COLUMN_STYLE,
     )
 
 
-def _recent_stats(sessions: list[WorkoutSession]) -> toga.Box:
-    """Create recent stats summary."""
-    # Count sessions this week
-    from datetime import datetime, timedelta
-
-    week_ago = datetime.now() - timedelta(days=7)
-    week_sessions = [s for s in sessions if s.started_at >= week_ago]
-
-    total_sets = sum(s.total_sets for s in week_sessions)
-    total_reps = sum(s.total_reps for s in week_sessions)
+def _recent_stats(week_sessions: list[SessionSummary]) -> toga.Box:
+    """Create recent stats summary for the sessions of the past week."""
+    total_sets = total_reps = 0
+    for session in week_sessions:
+        total_sets += session.total_sets
+        total_reps += session.total_reps
 
     return toga.Box(
         children=[
             toga.Label(
                 text="This Week",
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_SM,
-                    color=Theme.TEXT_TERTIARY,
-                    padding_bottom=Theme.SPACING_SM,
-                ),
+                style=_STATS_LABEL_STYLE,
             ),
             toga.Box(
                 children=[
@@ -321,14 +418,10 @@ def _recent_stats(sessions: list[WorkoutSession]) -> toga.Box:
                     _stat_item(str(total_sets), "sets"),
                     _stat_item(str(total_reps), "reps"),
                 ],
-                style=Pack(direction=ROW),
+                style=_ROW_STYLE,
             ),
         ],
-        style=Pack(
-            direction=COLUMN,
-            padding=Theme.SPACING_BASE,
-            background_color=Theme.SURFACE,
-        ),
+        style=_STATS_STYLE,
     )
 
 
@@ -338,25 +431,12 @@ def _stat_item(value: str, label: str) -> toga.Box:
         children=[
             toga.Label(
                 text=value,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_2XL,
-                    font_weight=BOLD,
-                    color=Theme.TEXT_PRIMARY,
-                    text_align=CENTER,
-                ),
+                style=_STAT_VALUE_STYLE,
             ),
             toga.Label(
                 text=label,
-                style=Pack(
-                    font_size=Theme.FONT_SIZE_XS,
-                    color=Theme.TEXT_SECONDARY,
-                    text_align=CENTER,
-                ),
+                style=_STAT_LABEL_STYLE,
             ),
         ],
-        style=Pack(
-            direction=COLUMN,
-            flex=1,
-            alignment=CENTER,
-        ),
+        style=_STAT_ITEM_STYLE,
     )
@@ -1,7 +1,8 @@
 """IronLog - Main Application Entry Point."""
 
 import asyncio
-from typing import Optional
+from collections import OrderedDict, deque
+from typing import Callable, Optional
 from uuid import UUID
 
 import toga
@@ -10,9 +11,13 @@ from toga.style.pack import COLUMN
 
 from app.data.db import Database
 from app.data.repositories import AppStateRepository, SessionRepository, TemplateRepository
+from app.ui.home import HomeSnapshot
 from app.ui.tabs import TabBar, create_tab_bar
 from app.ui.theme import Theme
 
+# Number of pushed views kept around for reuse on repeat navigation
+_VIEW_CACHE_SIZE = 8
+
 
 class IronLogApp(toga.App):
     """
@@ -43,7 +48,15 @@ class IronLogApp(toga.App):
         # UI state
         self.tab_bar: Optional[TabBar] = None
         self.main_content: Optional[toga.Box] = None
-        self.navigation_stack: list = []
+        self.navigation_stack: deque[toga.Box] = deque(maxlen=16)
+        # Session data version the History tab was last built from
+        self._history_version: Optional[int] = None
+        # Home tab data, reused until one of the repositories it reads changes
+        self._home_snapshot: Optional[HomeSnapshot] = None
+        # Built views by (route, id), with the session data version they show
+        self._view_cache: OrderedDict[tuple[str, UUID], tuple[int, toga.Box]] = OrderedDict()
+        # View builders by route, imported once at startup
+        self._view_factories: dict[str, Callable[..., toga.Box]] = {}
 
     def startup(self) -> None:
         """Initialize the application."""
@@ -81,6 +94,35 @@ class IronLogApp(toga.App):
         # Show window
         self.main_window.show()
 
+        # Import pushed-view modules once, after the window is up, rather than
+        # inside each navigation method
+        from app.ui.exercise_detail import create_exercise_detail_view
+        from app.ui.history import create_session_detail_view
+        from app.ui.session import create_session_view
+        from app.ui.templates import create_template_edit_view
+
+        self._view_factories = {
+            "session": create_session_view,
+            "exercise": create_exercise_detail_view,
+            "template_edit": create_template_edit_view,
+            "session_detail": create_session_detail_view,
+        }
+
+        def flush_and_exit(app: toga.App, **kwargs: object) -> bool:
+            """Write any queued sets before a desktop app closes.
+
+            on_exit does not fire when a mobile app is backgrounded or killed,
+            so the exercise view's ``_schedule_set_flush`` is the only flush
+            that reliably runs there.
+            """
+            if self.session_repo:
+                self.session_repo.flush_pending_sets()
+            return True
+
+        # toga.App.__init__ stores its on_exit argument as an instance
+        # attribute, so the handler is assigned here rather than overridden
+        self.on_exit = flush_and_exit
+
     # =========================================================================
     # Navigation Methods
     # =========================================================================
@@ -102,43 +144,73 @@ class IronLogApp(toga.App):
         self.tab_bar.refresh_current_tab()
 
     def navigate_to_history(self) -> None:
-        """Navigate to history tab."""
+        """Navigate to history tab, rebuilding it only if sessions changed."""
         self._show_tab_bar()
+        # select_tab builds the tab if it has no content yet
+        needs_build = self.tab_bar.tabs[2].content is None
         self.tab_bar.select_tab(2)
-        self.tab_bar.refresh_current_tab()
+        if not needs_build and self._history_version != self.session_repo.version:
+            self.tab_bar.refresh_current_tab()
+        self._history_version = self.session_repo.version
 
     def navigate_to_session(self, session_id: UUID) -> None:
         """Navigate to active session view."""
-        from app.ui.session import create_session_view
-
         self._hide_tab_bar()
-        view = create_session_view(self, session_id)
+        view = self._view_factories["session"](self, session_id)
         self._push_view(view)
 
     def navigate_to_exercise(self, session_id: UUID, exercise_id: UUID) -> None:
         """Navigate to exercise detail view."""
-        from app.ui.exercise_detail import create_exercise_detail_view
-
         self._hide_tab_bar()
-        view = create_exercise_detail_view(self, session_id, exercise_id)
+        view = self._cached_view(
+            ("exercise", exercise_id),
+            lambda: self._view_factories["exercise"](self, session_id, exercise_id),
+        )
         self._push_view(view)
 
     def navigate_to_template_edit(self, template_id: UUID) -> None:
         """Navigate to template edit view."""
-        from app.ui.templates import create_template_edit_view
-
         self._hide_tab_bar()
-        view = create_template_edit_view(self, template_id)
+        view = self._view_factories["template_edit"](self, template_id)
         self._push_view(view)
 
     def navigate_to_session_detail(self, session_id: UUID) -> None:
         """Navigate to session detail (read-only history view)."""
-        from app.ui.history import create_session_detail_view
-
         self._hide_tab_bar()
-        view = create_session_detail_view(self, session_id)
+        view = self._cached_view(
+            ("session_detail", session_id),
+            lambda: self._view_factories["session_detail"](self, session_id),
+        )
         self._push_view(view)
 
+    def _cached_view(
+        self,
+        key: tuple[str, UUID],
+        build: Callable[[], toga.Box],
+    ) -> toga.Box:
+        """
+        Get a previously built view, or build it if session data has changed.
+
+        Args:
+            key: Route name and the ID of the item the view shows.
+            build: Called to create the view on a cache miss.
+
+        Returns:
+            The view to push.
+        """
+        version = self.session_repo.version
+        cached = self._view_cache.get(key)
+        if cached is not None and cached[0] == version:
+            self._view_cache.move_to_end(key)
+            return cached[1]
+
+        view = build()
+        self._view_cache[key] = (version, view)
+        self._view_cache.move_to_end(key)
+        if len(self._view_cache) > _VIEW_CACHE_SIZE:
+            self._view_cache.popitem(last=False)
+        return view
+
     def _show_tab_bar(self) -> None:
         """Show the tab bar navigation."""
         self.main_content.clear()
@@ -151,8 +223,9 @@ class IronLogApp(toga.App):
 
     def _push_view(self, view: toga.Box) -> None:
         """Push a view onto the navigation stack."""
-        self.main_content.clear()
-        self.main_content.add(view)
+        if self.navigation_stack and self.navigation_stack[-1] is view:
+            return
+        self._show_view(view)
         self.navigation_stack.append(view)
 
     def _pop_view(self) -> None:
@@ -160,11 +233,18 @@ class IronLogApp(toga.App):
         if self.navigation_stack:
             self.navigation_stack.pop()
             if self.navigation_stack:
-                self.main_content.clear()
-                self.main_content.add(self.navigation_stack[-1])
+                self._show_view(self.navigation_stack[-1])
             else:
                 self._show_tab_bar()
 
+    def _show_view(self, view: toga.Box) -> None:
+        """Make a view the main content, unless it is already shown."""
+        children = self.main_content.children
+        if len(children) == 1 and children[0] is view:
+            return
+        self.main_content.clear()
+        self.main_content.add(view)
+
 
 def main() -> toga.App:
     """Application factory function."""
@@ -1,129 +1,113 @@
 """Database migrations for IronLog."""
 
-from typing import TYPE_CHECKING, Callable
+import logging
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from uuid import NAMESPACE_OID, UUID, uuid4, uuid5
 
 if TYPE_CHECKING:
     from app.data.db import Database
 
-# Migration functions - each takes a Database and applies changes
-Migration = Callable[["Database"], None]
+logger = logging.getLogger(__name__)
 
+# Migration functions - each applies its changes through a cursor inside the
+# transaction that also records the new schema version
+Migration = Callable[[sqlite3.Cursor], None]
 
-def migration_001_initial_schema(db: "Database") -> None:
-    """Create initial database schema."""
-    with db.transaction() as cursor:
-        # Workout templates
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS workout_templates (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                created_at TIMESTAMP NOT NULL
-            )
-            """
-        )
-
-        # Template exercises
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS template_exercises (
-                id TEXT PRIMARY KEY,
-                template_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                order_index INTEGER NOT NULL,
-                uses_weight INTEGER NOT NULL DEFAULT 1,
-                FOREIGN KEY (template_id) REFERENCES workout_templates(id) ON DELETE CASCADE
-            )
-            """
-        )
-
-        # Workout sessions
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS workout_sessions (
-                id TEXT PRIMARY KEY,
-                template_id TEXT,
-                template_name TEXT,
-                started_at TIMESTAMP NOT NULL,
-                ended_at TIMESTAMP,
-                duration_seconds INTEGER,
-                notes TEXT,
-                FOREIGN KEY (template_id) REFERENCES workout_templates(id) ON DELETE SET NULL
-            )
-            """
-        )
-
-        # Session exercises
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS session_exercises (
-                id TEXT PRIMARY KEY,
-                session_id TEXT NOT NULL,
-                name TEXT NOT NULL,
-                order_index INTEGER NOT NULL,
-                uses_weight INTEGER NOT NULL DEFAULT 1,
-                FOREIGN KEY (session_id) REFERENCES workout_sessions(id) ON DELETE CASCADE
-            )
-            """
-        )
-
-        # Sets
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sets (
-                id TEXT PRIMARY KEY,
-                session_exercise_id TEXT NOT NULL,
-                reps INTEGER NOT NULL,
-                weight REAL,
-                created_at TIMESTAMP NOT NULL,
-                FOREIGN KEY (session_exercise_id) REFERENCES session_exercises(id) ON DELETE CASCADE
-            )
-            """
-        )
+# Initial schema, one statement per entry. Kept as separate statements rather
+# than one executescript() call, which would commit the migration transaction.
+_INITIAL_SCHEMA = (
+    # Workout templates
+    """
+    CREATE TABLE IF NOT EXISTS workout_templates (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL
+    )
+    """,
+    # Template exercises
+    """
+    CREATE TABLE IF NOT EXISTS template_exercises (
+        id TEXT PRIMARY KEY,
+        template_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        order_index INTEGER NOT NULL,
+        uses_weight INTEGER NOT NULL DEFAULT 1,
+        FOREIGN KEY (template_id) REFERENCES workout_templates(id) ON DELETE CASCADE
+    )
+    """,
+    # Workout sessions
+    """
+    CREATE TABLE IF NOT EXISTS workout_sessions (
+        id TEXT PRIMARY KEY,
+        template_id TEXT,
+        template_name TEXT,
+        started_at TIMESTAMP NOT NULL,
+        ended_at TIMESTAMP,
+        duration_seconds INTEGER,
+        notes TEXT,
+        FOREIGN KEY (template_id) REFERENCES workout_templates(id) ON DELETE SET NULL
+    )
+    """,
+    # Session exercises
+    """
+    CREATE TABLE IF NOT EXISTS session_exercises (
+        id TEXT PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        order_index INTEGER NOT NULL,
+        uses_weight INTEGER NOT NULL DEFAULT 1,
+        FOREIGN KEY (session_id) REFERENCES workout_sessions(id) ON DELETE CASCADE
+    )
+    """,
+    # Sets
+    """
+    CREATE TABLE IF NOT EXISTS sets (
+        id TEXT PRIMARY KEY,
+        session_exercise_id TEXT NOT NULL,
+        reps INTEGER NOT NULL,
+        weight REAL,
+        created_at TIMESTAMP NOT NULL,
+        FOREIGN KEY (session_exercise_id) REFERENCES session_exercises(id) ON DELETE CASCADE
+    )
+    """,
+    # App state (key-value store)
+    """
+    CREATE TABLE IF NOT EXISTS app_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+    # Indexes for common queries
+    """
+    CREATE INDEX IF NOT EXISTS idx_template_exercises_template_id
+    ON template_exercises(template_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_session_exercises_session_id
+    ON session_exercises(session_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_sets_session_exercise_id
+    ON sets(session_exercise_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_workout_sessions_started_at
+    ON workout_sessions(started_at DESC)
+    """,
+)
 
-        # App state (key-value store)
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS app_state (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-            """
-        )
 
-        # Indexes for common queries
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_template_exercises_template_id
-            ON template_exercises(template_id)
-            """
-        )
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_session_exercises_session_id
-            ON session_exercises(session_id)
-            """
-        )
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_sets_session_exercise_id
-            ON sets(session_exercise_id)
-            """
-        )
-        cursor.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_workout_sessions_started_at
-            ON workout_sessions(started_at DESC)
-            """
-        )
+def migration_001_initial_schema(cursor: sqlite3.Cursor) -> None:
+    """Create initial database schema."""
+    for statement in _INITIAL_SCHEMA:
+        cursor.execute(statement)
 
 
-def migration_002_seed_templates(db: "Database") -> None:
+def migration_002_seed_templates(cursor: sqlite3.Cursor) -> None:
     """Seed default workout templates."""
-    from datetime import datetime
-    from uuid import uuid4
-
-    templates = [
+    templates: list[dict[str, Any]] = [
         {
             "name": "Push Day",
             "exercises": [
@@ -156,32 +140,206 @@ def migration_002_seed_templates(db: "Database") -> None:
         },
     ]
 
-    with db.transaction() as cursor:
-        for template_data in templates:
-            template_id = str(uuid4())
-            cursor.execute(
-                """
-                INSERT INTO workout_templates (id, name, created_at)
-                VALUES (?, ?, ?)
-                """,
-                (template_id, template_data["name"], datetime.now()),
-            )
+    now = datetime.now()
+    template_rows = []
+    exercise_rows: list[tuple[str, str, str, int, int]] = []
+    for template_data in templates:
+        template_id = str(uuid4())
+        template_rows.append((template_id, template_data["name"], now))
+        exercise_rows.extend(
+            (str(uuid4()), template_id, name, order_idx, 1 if uses_weight else 0)
+            for order_idx, (name, uses_weight) in enumerate(template_data["exercises"])
+        )
+
+    cursor.executemany(
+        """
+        INSERT INTO workout_templates (id, name, created_at)
+        VALUES (?, ?, ?)
+        """,
+        template_rows,
+    )
+    cursor.executemany(
+        """
+        INSERT INTO template_exercises (id, template_id, name, order_index, uses_weight)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        exercise_rows,
+    )
+
+
+# Child-table indexes that hold every column the session loaders read, in
+# load order, so loading a session never touches the table rows
+_COVERING_INDEXES = (
+    "DROP INDEX IF EXISTS idx_session_exercises_session_id",
+    """
+    CREATE INDEX idx_session_exercises_session_id
+    ON session_exercises(session_id, order_index, id, name, uses_weight)
+    """,
+    "DROP INDEX IF EXISTS idx_sets_session_exercise_id",
+    """
+    CREATE INDEX idx_sets_session_exercise_id
+    ON sets(session_exercise_id, created_at, id, reps, weight)
+    """,
+)
+
+
+def migration_003_covering_indexes(cursor: sqlite3.Cursor) -> None:
+    """Replace the child-table foreign key indexes with covering indexes."""
+    for statement in _COVERING_INDEXES:
+        cursor.execute(statement)
+
+
+# Tables whose IDs migration 004 converts, parents before children
+_BLOB_ID_TABLES = (
+    (
+        "workout_templates",
+        """
+        CREATE TABLE workout_templates (
+            id BLOB PRIMARY KEY,
+            name TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL
+        )
+        """,
+        "uuid_blob(id), name, created_at",
+    ),
+    (
+        "template_exercises",
+        """
+        CREATE TABLE template_exercises (
+            id BLOB PRIMARY KEY,
+            template_id BLOB NOT NULL,
+            name TEXT NOT NULL,
+            order_index INTEGER NOT NULL,
+            uses_weight INTEGER NOT NULL DEFAULT 1,
+            FOREIGN KEY (template_id) REFERENCES workout_templates(id) ON DELETE CASCADE
+        )
+        """,
+        "uuid_blob(id), uuid_blob(template_id), name, order_index, uses_weight",
+    ),
+    (
+        "workout_sessions",
+        """
+        CREATE TABLE workout_sessions (
+            id BLOB PRIMARY KEY,
+            template_id BLOB,
+            template_name TEXT,
+            started_at TIMESTAMP NOT NULL,
+            ended_at TIMESTAMP,
+            duration_seconds INTEGER,
+            notes TEXT,
+            FOREIGN KEY (template_id) REFERENCES workout_templates(id) ON DELETE SET NULL
+        )
+        """,
+        "uuid_blob(id), uuid_blob(template_id), template_name, started_at, ended_at, "
+        "duration_seconds, notes",
+    ),
+    (
+        "session_exercises",
+        """
+        CREATE TABLE session_exercises (
+            id BLOB PRIMARY KEY,
+            session_id BLOB NOT NULL,
+            name TEXT NOT NULL,
+            order_index INTEGER NOT NULL,
+            uses_weight INTEGER NOT NULL DEFAULT 1,
+            FOREIGN KEY (session_id) REFERENCES workout_sessions(id) ON DELETE CASCADE
+        )
+        """,
+        "uuid_blob(id), uuid_blob(session_id), name, order_index, uses_weight",
+    ),
+    (
+        "sets",
+        """
+        CREATE TABLE sets (
+            id BLOB PRIMARY KEY,
+            session_exercise_id BLOB NOT NULL,
+            reps INTEGER NOT NULL,
+            weight REAL,
+            created_at TIMESTAMP NOT NULL,
+            FOREIGN KEY (session_exercise_id) REFERENCES session_exercises(id) ON DELETE CASCADE
+        )
+        """,
+        "uuid_blob(id), uuid_blob(session_exercise_id), reps, weight, created_at",
+    ),
+)
 
-            for order_idx, (name, uses_weight) in enumerate(template_data["exercises"]):
-                exercise_id = str(uuid4())
-                cursor.execute(
-                    """
-                    INSERT INTO template_exercises (id, template_id, name, order_index, uses_weight)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (exercise_id, template_id, name, order_idx, 1 if uses_weight else 0),
-                )
+# Indexes dropped along with the old tables, recreated on the new ones
+_BLOB_ID_INDEXES = (
+    """
+    CREATE INDEX idx_template_exercises_template_id
+    ON template_exercises(template_id)
+    """,
+    """
+    CREATE INDEX idx_session_exercises_session_id
+    ON session_exercises(session_id, order_index, id, name, uses_weight)
+    """,
+    """
+    CREATE INDEX idx_sets_session_exercise_id
+    ON sets(session_exercise_id, created_at, id, reps, weight)
+    """,
+    """
+    CREATE INDEX idx_workout_sessions_started_at
+    ON workout_sessions(started_at DESC)
+    """,
+)
+
+
+def _uuid_blob(value: Optional[str]) -> Optional[bytes]:
+    """
+    Convert a UUID stored as text to its 16-byte form.
+
+    Text that isn't a valid UUID is mapped to a name-based UUID derived from
+    it instead of failing the migration, which would otherwise fail every
+    startup. The mapping is deterministic, so foreign keys referring to the
+    same malformed ID still match after conversion.
+    """
+    if value is None:
+        return None
+    try:
+        return UUID(str(value)).bytes
+    except ValueError:
+        logger.warning("Replacing malformed id %r with a derived UUID", value)
+        return uuid5(NAMESPACE_OID, str(value)).bytes
+
+
+def migration_004_blob_ids(cursor: sqlite3.Cursor) -> None:
+    """
+    Store IDs as 16-byte BLOBs instead of 36-character text.
+
+    Each table is renamed aside, which also repoints its children's foreign
+    keys at the old copy, then recreated and refilled parents first. The old
+    tables are dropped children first, so no cascade reaches the new rows.
+    """
+    cursor.connection.create_function("uuid_blob", 1, _uuid_blob, deterministic=True)
+
+    for table, _, _ in _BLOB_ID_TABLES:
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    for table, create_sql, select_columns in _BLOB_ID_TABLES:
+        cursor.execute(create_sql)
+        cursor.execute(f"INSERT INTO {table} SELECT {select_columns} FROM {table}_old")
+    for table, _, _ in reversed(_BLOB_ID_TABLES):
+        cursor.execute(f"DROP TABLE {table}_old")
+    for statement in _BLOB_ID_INDEXES:
+        cursor.execute(statement)
+
+
+def migration_005_exercise_name_index(cursor: sqlite3.Cursor) -> None:
+    """Index session exercises by name for last-weight lookups."""
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_session_exercises_name
+        ON session_exercises(name, id)
+        """
+    )
 
 
 # List of all migrations in order
 MIGRATIONS: list[tuple[int, str, Migration]] = [
     (1, "initial_schema", migration_001_initial_schema),
     (2, "seed_templates", migration_002_seed_templates),
+    (3, "covering_indexes", migration_003_covering_indexes),
+    (4, "blob_ids", migration_004_blob_ids),
+    (5, "exercise_name_index", migration_005_exercise_name_index),
 ]
 
 
@@ -189,34 +347,27 @@ def get_current_version(db: "Database") -> int:
     """
     Get the current schema version.
 
+    The schema_version table must exist; apply_migrations creates it first.
+
     Args:
         db: Database instance
 
     Returns:
-        Current schema version (0 if not initialized)
+        Current schema version (0 if no migrations have been applied)
     """
-    with db.cursor() as cursor:
-        # Check if schema_version table exists
-        cursor.execute(
-            """
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='schema_version'
-            """
-        )
-        if cursor.fetchone() is None:
-            return 0
-
-        cursor.execute("SELECT version FROM schema_version ORDER BY version DESC LIMIT 1")
-        row = cursor.fetchone()
-        return row["version"] if row else 0
+    row = db.execute("SELECT COALESCE(MAX(version), 0) AS version FROM schema_version").fetchone()
+    return int(row["version"])
 
 
-def apply_migrations(db: "Database") -> None:
+def apply_migrations(db: "Database") -> int:
     """
     Apply all pending migrations.
 
     Args:
         db: Database instance
+
+    Returns:
+        Number of migrations applied
     """
     # Ensure schema_version table exists
     with db.transaction() as cursor:
@@ -230,20 +381,23 @@ def apply_migrations(db: "Database") -> None:
         )
 
     current_version = get_current_version(db)
+    applied = 0
 
     for version, name, migration_fn in MIGRATIONS:
         if version > current_version:
-            print(f"Applying migration {version}: {name}")
+            logger.info("Applying migration %d: %s", version, name)
             try:
-                migration_fn(db)
+                # Body and version row commit together, or not at all
                 with db.transaction() as cursor:
-                    from datetime import datetime
-
+                    migration_fn(cursor)
                     cursor.execute(
                         "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
                         (version, datetime.now()),
                     )
-                print(f"  ✓ Migration {version} applied successfully")
-            except Exception as e:
-                print(f"  ✗ Migration {version} failed: {e}")
+                logger.info("Migration %d applied successfully", version)
+            except Exception:
+                logger.exception("Migration %d failed", version)
                 raise
+            applied += 1
+
+    return applied
@@ -3,14 +3,17 @@
 from app.core.models import (
     AppState,
     SessionExercise,
+    SessionSummary,
     Set,
     TemplateExercise,
     TimerState,
     WorkoutSession,
     WorkoutTemplate,
     format_date,
+    format_date_batch,
     format_datetime,
     format_duration,
+    format_set,
     format_weight,
 )
 from app.core.timer import Timer
@@ -18,6 +21,7 @@ from app.core.timer import Timer
 __all__ = [
     "AppState",
     "SessionExercise",
+    "SessionSummary",
     "Set",
     "TemplateExercise",
     "Timer",
@@ -25,7 +29,9 @@ __all__ = [
     "WorkoutSession",
     "WorkoutTemplate",
     "format_date",
+    "format_date_batch",
     "format_datetime",
     "format_duration",
+    "format_set",
     "format_weight",
 ]
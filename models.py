@@ -1,12 +1,14 @@
 """Domain models for IronLog."""
 
+import os
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Set:
     """A single set within an exercise."""
 
@@ -22,18 +24,19 @@ class Set:
         session_exercise_id: UUID,
         reps: int,
         weight: Optional[float] = None,
+        now: Optional[datetime] = None,
     ) -> "Set":
-        """Create a new set with auto-generated ID and timestamp."""
+        """Create a new set with auto-generated ID and timestamp (or `now`)."""
         return cls(
             id=uuid4(),
             session_exercise_id=session_exercise_id,
             reps=reps,
             weight=weight,
-            created_at=datetime.now(),
+            created_at=now if now is not None else datetime.now(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionExercise:
     """An exercise within a workout session."""
 
@@ -78,8 +81,28 @@ class SessionExercise:
             sets=[],
         )
 
-
-@dataclass
+    @classmethod
+    def from_template_exercises(
+        cls,
+        session_id: UUID,
+        template_exercises: list["TemplateExercise"],
+    ) -> list["SessionExercise"]:
+        """Create session exercises for all of a template's exercises."""
+        ids = _batch_uuid4(len(template_exercises))
+        return [
+            cls(
+                id=exercise_id,
+                session_id=session_id,
+                name=template_exercise.name,
+                order_index=template_exercise.order_index,
+                uses_weight=template_exercise.uses_weight,
+                sets=[],
+            )
+            for exercise_id, template_exercise in zip(ids, template_exercises, strict=True)
+        ]
+
+
+@dataclass(slots=True)
 class WorkoutSession:
     """A workout session (active or completed)."""
 
@@ -97,13 +120,14 @@ class WorkoutSession:
         cls,
         template_id: Optional[UUID] = None,
         template_name: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> "WorkoutSession":
-        """Create a new workout session with auto-generated ID and timestamp."""
+        """Create a new workout session with auto-generated ID and timestamp (or `now`)."""
         return cls(
             id=uuid4(),
             template_id=template_id,
             template_name=template_name,
-            started_at=datetime.now(),
+            started_at=now if now is not None else datetime.now(),
             ended_at=None,
             duration_seconds=None,
             notes=None,
@@ -118,22 +142,34 @@ class WorkoutSession:
     @property
     def total_sets(self) -> int:
         """Get total number of sets in this session."""
-        return sum(len(ex.sets) for ex in self.exercises)
+        return self.compute_stats()[0]
 
     @property
     def total_reps(self) -> int:
         """Get total number of reps in this session."""
-        return sum(s.reps for ex in self.exercises for s in ex.sets)
+        return self.compute_stats()[1]
 
     @property
     def total_volume(self) -> float:
         """Get total volume (weight * reps) in this session."""
-        total = 0.0
+        return self.compute_stats()[2]
+
+    def compute_stats(self) -> tuple[int, int, float]:
+        """
+        Get total sets, reps and volume in a single pass over the sets.
+
+        Returns:
+            Tuple of (total sets, total reps, total volume)
+        """
+        total_sets = total_reps = 0
+        total_volume = 0.0
         for ex in self.exercises:
             for s in ex.sets:
+                total_sets += 1
+                total_reps += s.reps
                 if s.weight is not None:
-                    total += s.weight * s.reps
-        return total
+                    total_volume += s.weight * s.reps
+        return total_sets, total_reps, total_volume
 
     def formatted_duration(self) -> str:
         """Get formatted duration string."""
@@ -142,7 +178,28 @@ class WorkoutSession:
         return format_duration(self.duration_seconds)
 
 
-@dataclass
+@dataclass(slots=True)
+class SessionSummary:
+    """A session's list-view details, with totals computed by the database."""
+
+    id: UUID
+    template_name: Optional[str]
+    started_at: datetime
+    ended_at: Optional[datetime]
+    duration_seconds: Optional[int]
+    exercise_count: int
+    total_sets: int
+    total_reps: int
+    total_volume: float
+
+    def formatted_duration(self) -> str:
+        """Get formatted duration string."""
+        if self.duration_seconds is None:
+            return "--:--"
+        return format_duration(self.duration_seconds)
+
+
+@dataclass(slots=True)
 class TemplateExercise:
     """An exercise within a workout template."""
 
@@ -170,7 +227,7 @@ class TemplateExercise:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkoutTemplate:
     """A reusable workout template."""
 
@@ -178,14 +235,18 @@ class WorkoutTemplate:
     name: str
     created_at: datetime
     exercises: list[TemplateExercise] = field(default_factory=list)
+    # Exercise rows as last loaded or saved, so unchanged ones aren't rewritten
+    _saved_exercises: Optional[list[tuple]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
-    def create(cls, name: str) -> "WorkoutTemplate":
-        """Create a new template with auto-generated ID and timestamp."""
+    def create(cls, name: str, now: Optional[datetime] = None) -> "WorkoutTemplate":
+        """Create a new template with auto-generated ID and timestamp (or `now`)."""
         return cls(
             id=uuid4(),
             name=name,
-            created_at=datetime.now(),
+            created_at=now if now is not None else datetime.now(),
             exercises=[],
         )
 
@@ -195,7 +256,7 @@ class WorkoutTemplate:
         return len(self.exercises)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerState:
     """Persistent timer state."""
 
@@ -217,7 +278,7 @@ class TimerState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Application state that persists across launches."""
 
@@ -226,11 +287,16 @@ class AppState:
     timer_state: Optional[TimerState]
 
 
+def _batch_uuid4(count: int) -> list[UUID]:
+    """Generate random (version 4) UUIDs from a single os.urandom call."""
+    data = os.urandom(16 * count)
+    return [UUID(bytes=data[i : i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+
 def format_duration(seconds: int) -> str:
     """Format duration in seconds to mm:ss or hh:mm:ss."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
         return f"{hours:d}:{minutes:02d}:{secs:02d}"
@@ -246,6 +312,14 @@ def format_weight(weight: Optional[float]) -> str:
     return f"{weight:.1f}"
 
 
+def format_set(workout_set: Set, uses_weight: bool = True) -> str:
+    """Format a set for display, e.g. "135 × 10", "62.5 × 8" or "10 reps"."""
+    if uses_weight and workout_set.weight:
+        return f"{format_weight(workout_set.weight)} × {workout_set.reps}"
+    return f"{workout_set.reps} reps"
+
+
+@lru_cache(maxsize=512)
 def format_datetime(dt: datetime) -> str:
     """Format datetime for display."""
     return dt.strftime("%b %d, %Y at %I:%M %p")
@@ -253,14 +327,33 @@ def format_datetime(dt: datetime) -> str:
 
 def format_date(dt: datetime) -> str:
     """Format date for display."""
+    return _format_day(dt.date(), datetime.now().date())
+
+
+def format_date_batch(dts: list[datetime]) -> list[str]:
+    """Format many dates for display against a single reading of today."""
     today = datetime.now().date()
-    date = dt.date()
+    return [_format_day(dt.date(), today) for dt in dts]
+
+
+# English names, matching strftime's %A and %b in the C locale
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=512)
+def _format_day(day: date, today: date) -> str:
+    """
+    Format a day relative to today.
 
-    if date == today:
+    Cached on the (day, today) pair, so sessions that share a day are
+    formatted once and the labels still roll over at midnight.
+    """
+    if day == today:
         return "Today"
-    days_diff = (today - date).days
+    days_diff = (today - day).days
     if days_diff == 1:
         return "Yesterday"
     if days_diff < 7:
-        return dt.strftime("%A")  # Day name
-    return dt.strftime("%b %d, %Y")
+        return _WEEKDAYS[day.weekday()]  # Day name
+    return f"{_MONTHS[day.month - 1]} {day.day:02d}, {day.year}"
@@ -7,6 +7,7 @@ from uuid import UUID
 
 from app.core.models import (
     SessionExercise,
+    SessionSummary,
     Set,
     TemplateExercise,
     TimerState,
@@ -15,103 +16,245 @@ from app.core.models import (
 )
 from app.data.db import Database
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup, absent on mobile builds
+    _HAS_ORJSON = False
+
+_UPSERT_SESSION_SQL = """
+    INSERT INTO workout_sessions
+        (id, template_id, template_name, started_at, ended_at, duration_seconds, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        template_id = excluded.template_id,
+        template_name = excluded.template_name,
+        ended_at = excluded.ended_at,
+        duration_seconds = excluded.duration_seconds,
+        notes = excluded.notes
+"""
+
+_UPSERT_SESSION_EXERCISE_SQL = """
+    INSERT INTO session_exercises (id, session_id, name, order_index, uses_weight)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        name = excluded.name,
+        order_index = excluded.order_index,
+        uses_weight = excluded.uses_weight
+"""
+
+_UPSERT_SET_SQL = """
+    INSERT INTO sets (id, session_exercise_id, reps, weight, created_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        reps = excluded.reps,
+        weight = excluded.weight
+"""
+
+# Session rows as read by _row_to_session, with the filters each caller needs
+_SELECT_SESSION_SQL = """
+    SELECT id, template_id, template_name, started_at, ended_at,
+           duration_seconds, notes
+    FROM workout_sessions
+"""
+_SESSIONS_BY_RECENCY_SQL = _SELECT_SESSION_SQL + "ORDER BY started_at DESC LIMIT ?"
+_SESSION_BY_ID_SQL = _SELECT_SESSION_SQL + "WHERE id = ?"
+_ACTIVE_SESSION_SQL = (
+    _SELECT_SESSION_SQL + "WHERE ended_at IS NULL ORDER BY started_at DESC LIMIT 1"
+)
+
+_EXERCISE_BY_ID_SQL = """
+    SELECT id, session_id, name, order_index, uses_weight
+    FROM session_exercises
+    WHERE id = ?
+"""
+
+# Child rows leave out the parent ID column; loaders reuse the parent's UUID
+_EXERCISE_SETS_SQL = """
+    SELECT id, reps, weight, created_at
+    FROM sets
+    WHERE session_exercise_id = ?
+    ORDER BY created_at
+"""
+
+_INSERT_TEMPLATE_EXERCISE_SQL = """
+    INSERT INTO template_exercises (id, template_id, name, order_index, uses_weight)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_TEMPLATE_BY_ID_SQL = "SELECT id, name, created_at FROM workout_templates WHERE id = ?"
+
+_TEMPLATE_EXERCISES_SQL = """
+    SELECT id, name, order_index, uses_weight
+    FROM template_exercises
+    WHERE template_id = ?
+    ORDER BY order_index
+"""
+
+# Session list columns with per-session totals; select FROM a workout_sessions
+# row source aliased ws, followed by _SUMMARY_JOINS and GROUP BY ws.id
+_SUMMARY_COLUMNS = """
+    ws.id, ws.template_name, ws.started_at, ws.ended_at, ws.duration_seconds,
+    COUNT(DISTINCT se.id) AS exercise_count,
+    COUNT(s.id) AS total_sets,
+    COALESCE(SUM(s.reps), 0) AS total_reps,
+    COALESCE(SUM(s.weight * s.reps), 0.0) AS total_volume
+"""
+_SUMMARY_JOINS = """
+    LEFT JOIN session_exercises se ON se.session_id = ws.id
+    LEFT JOIN sets s ON s.session_exercise_id = se.id
+"""
+
+
+def _session_params(session: WorkoutSession) -> tuple:
+    """Get the _UPSERT_SESSION_SQL parameters for a session."""
+    return (
+        session.id.bytes,
+        session.template_id.bytes if session.template_id else None,
+        session.template_name,
+        session.started_at,
+        session.ended_at,
+        session.duration_seconds,
+        session.notes,
+    )
+
+
+def _session_exercise_params(exercise: SessionExercise) -> tuple:
+    """Get the _UPSERT_SESSION_EXERCISE_SQL parameters for an exercise."""
+    return (
+        exercise.id.bytes,
+        exercise.session_id.bytes,
+        exercise.name,
+        exercise.order_index,
+        1 if exercise.uses_weight else 0,
+    )
+
+
+def _template_exercise_params(template: WorkoutTemplate) -> list[tuple]:
+    """Get the _INSERT_TEMPLATE_EXERCISE_SQL parameters for a template's exercises."""
+    return [
+        (
+            exercise.id.bytes,
+            template.id.bytes,
+            exercise.name,
+            exercise.order_index,
+            1 if exercise.uses_weight else 0,
+        )
+        for exercise in template.exercises
+    ]
+
+
+def _set_params(workout_set: Set) -> tuple:
+    """Get the _UPSERT_SET_SQL parameters for a set."""
+    return (
+        workout_set.id.bytes,
+        workout_set.session_exercise_id.bytes,
+        workout_set.reps,
+        workout_set.weight,
+        workout_set.created_at,
+    )
+
 
 class TemplateRepository:
     """Repository for workout template operations."""
 
     def __init__(self, db: Database) -> None:
         self.db = db
+        # Bumped by every write, so views can tell when cached content is stale
+        self.version = 0
 
     def get_all(self) -> list[WorkoutTemplate]:
-        """Get all workout templates with their exercises."""
-        templates: list[WorkoutTemplate] = []
-
-        with self.db.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT id, name, created_at
-                FROM workout_templates
-                ORDER BY name
-                """
-            )
-            template_rows = cursor.fetchall()
+        """Get all workout templates with their exercises, in one query."""
+        rows = self.db.execute(
+            """
+            SELECT t.id, t.name, t.created_at,
+                   e.id AS exercise_id, e.name AS exercise_name,
+                   e.order_index, e.uses_weight
+            FROM workout_templates t
+            LEFT JOIN template_exercises e ON e.template_id = t.id
+            ORDER BY t.name, t.id, e.order_index
+            """
+        )
 
-            for row in template_rows:
+        templates: list[WorkoutTemplate] = []
+        template: Optional[WorkoutTemplate] = None
+        for row in rows:
+            if template is None or template.id.bytes != row["id"]:
                 template = WorkoutTemplate(
-                    id=UUID(row["id"]),
+                    id=UUID(bytes=row["id"]),
                     name=row["name"],
                     created_at=row["created_at"],
                     exercises=[],
                 )
+                templates.append(template)
 
-                # Fetch exercises for this template
-                cursor.execute(
-                    """
-                    SELECT id, template_id, name, order_index, uses_weight
-                    FROM template_exercises
-                    WHERE template_id = ?
-                    ORDER BY order_index
-                    """,
-                    (str(template.id),),
-                )
-                for ex_row in cursor.fetchall():
-                    template.exercises.append(
-                        TemplateExercise(
-                            id=UUID(ex_row["id"]),
-                            template_id=UUID(ex_row["template_id"]),
-                            name=ex_row["name"],
-                            order_index=ex_row["order_index"],
-                            uses_weight=bool(ex_row["uses_weight"]),
-                        )
+            if row["exercise_id"] is not None:
+                template.exercises.append(
+                    TemplateExercise(
+                        id=UUID(bytes=row["exercise_id"]),
+                        template_id=template.id,
+                        name=row["exercise_name"],
+                        order_index=row["order_index"],
+                        uses_weight=bool(row["uses_weight"]),
                     )
+                )
 
-                templates.append(template)
-
+        for template in templates:
+            template._saved_exercises = _template_exercise_params(template)
         return templates
 
     def get_by_id(self, template_id: UUID) -> Optional[WorkoutTemplate]:
         """Get a template by ID."""
         with self.db.cursor() as cursor:
-            cursor.execute(
-                "SELECT id, name, created_at FROM workout_templates WHERE id = ?",
-                (str(template_id),),
-            )
+            cursor.execute(_TEMPLATE_BY_ID_SQL, (template_id.bytes,))
             row = cursor.fetchone()
             if row is None:
                 return None
 
             template = WorkoutTemplate(
-                id=UUID(row["id"]),
+                id=UUID(bytes=row["id"]),
                 name=row["name"],
                 created_at=row["created_at"],
                 exercises=[],
             )
 
-            cursor.execute(
-                """
-                SELECT id, template_id, name, order_index, uses_weight
-                FROM template_exercises
-                WHERE template_id = ?
-                ORDER BY order_index
-                """,
-                (str(template_id),),
-            )
-            for ex_row in cursor.fetchall():
+            cursor.execute(_TEMPLATE_EXERCISES_SQL, (template_id.bytes,))
+            for ex_row in cursor:
                 template.exercises.append(
                     TemplateExercise(
-                        id=UUID(ex_row["id"]),
-                        template_id=UUID(ex_row["template_id"]),
+                        id=UUID(bytes=ex_row["id"]),
+                        template_id=template.id,
                         name=ex_row["name"],
                         order_index=ex_row["order_index"],
                         uses_weight=bool(ex_row["uses_weight"]),
                     )
                 )
 
-            return template
+        template._saved_exercises = _template_exercise_params(template)
+        return template
 
     def save(self, template: WorkoutTemplate) -> None:
-        """Save a template (insert or update)."""
+        """
+        Save a template (insert or update).
+
+        Exercises are only rewritten when they differ from what was last
+        loaded or saved; a rename alone is a single-row UPDATE.
+
+        Args:
+            template: Template to save
+        """
+        exercise_params = _template_exercise_params(template)
+        self.version += 1
         with self.db.transaction() as cursor:
+            if exercise_params == template._saved_exercises:
+                cursor.execute(
+                    "UPDATE workout_templates SET name = ? WHERE id = ?",
+                    (template.name, template.id.bytes),
+                )
+                if cursor.rowcount:
+                    return
+
             # Upsert template
             cursor.execute(
                 """
@@ -119,133 +262,275 @@ class TemplateRepository:
                 VALUES (?, ?, ?)
                 ON CONFLICT(id) DO UPDATE SET name = excluded.name
                 """,
-                (str(template.id), template.name, template.created_at),
+                (template.id.bytes, template.name, template.created_at),
             )
 
             # Delete existing exercises and re-insert
             cursor.execute(
                 "DELETE FROM template_exercises WHERE template_id = ?",
-                (str(template.id),),
+                (template.id.bytes,),
             )
-
-            for exercise in template.exercises:
-                cursor.execute(
-                    """
-                    INSERT INTO template_exercises (id, template_id, name, order_index, uses_weight)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        str(exercise.id),
-                        str(template.id),
-                        exercise.name,
-                        exercise.order_index,
-                        1 if exercise.uses_weight else 0,
-                    ),
-                )
+            cursor.executemany(_INSERT_TEMPLATE_EXERCISE_SQL, exercise_params)
+        template._saved_exercises = exercise_params
 
     def delete(self, template_id: UUID) -> None:
         """Delete a template by ID."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                "DELETE FROM workout_templates WHERE id = ?",
-                (str(template_id),),
-            )
+        self.version += 1
+        self.db.execute(
+            "DELETE FROM workout_templates WHERE id = ?",
+            (template_id.bytes,),
+        )
 
     def duplicate(self, template_id: UUID, new_name: str) -> Optional[WorkoutTemplate]:
         """Duplicate a template with a new name."""
-        original = self.get_by_id(template_id)
-        if original is None:
-            return None
+        with self.db.transaction() as cursor:
+            cursor.execute("SELECT 1 FROM workout_templates WHERE id = ?", (template_id.bytes,))
+            if cursor.fetchone() is None:
+                return None
 
-        new_template = WorkoutTemplate.create(new_name)
-        for ex in original.exercises:
-            new_ex = TemplateExercise.create(
-                template_id=new_template.id,
-                name=ex.name,
-                order_index=ex.order_index,
-                uses_weight=ex.uses_weight,
+            new_template = WorkoutTemplate.create(new_name)
+            cursor.execute(
+                "INSERT INTO workout_templates (id, name, created_at) VALUES (?, ?, ?)",
+                (new_template.id.bytes, new_template.name, new_template.created_at),
             )
-            new_template.exercises.append(new_ex)
 
-        self.save(new_template)
+            # Only the copied columns are read; the originals are never built
+            cursor.execute(
+                """
+                SELECT name, order_index, uses_weight
+                FROM template_exercises
+                WHERE template_id = ?
+                ORDER BY order_index
+                """,
+                (template_id.bytes,),
+            )
+            new_template.exercises = [
+                TemplateExercise.create(
+                    template_id=new_template.id,
+                    name=row["name"],
+                    order_index=row["order_index"],
+                    uses_weight=bool(row["uses_weight"]),
+                )
+                for row in cursor
+            ]
+            exercise_params = _template_exercise_params(new_template)
+            cursor.executemany(_INSERT_TEMPLATE_EXERCISE_SQL, exercise_params)
+        new_template._saved_exercises = exercise_params
+
+        self.version += 1
         return new_template
 
+    def mark_changed(self) -> None:
+        """Record a change to template data made outside this repository."""
+        self.version += 1
+
 
 class SessionRepository:
     """Repository for workout session operations."""
 
     def __init__(self, db: Database) -> None:
         self.db = db
+        # Sets queued by save_set_deferred, oldest first
+        self._pending_sets: list[Set] = []
+        # Bumped by every write, so views can tell when cached content is stale
+        self.version = 0
 
     def get_all(self, limit: int = 50) -> list[WorkoutSession]:
         """Get all sessions, newest first."""
-        sessions: list[WorkoutSession] = []
-
+        self.flush_pending_sets()
         with self.db.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT id, template_id, template_name, started_at, ended_at,
-                       duration_seconds, notes
-                FROM workout_sessions
-                ORDER BY started_at DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
+            cursor.execute(_SESSIONS_BY_RECENCY_SQL, (limit,))
 
-            for row in cursor.fetchall():
-                session = self._row_to_session(row)
-                self._load_exercises(cursor, session)
-                sessions.append(session)
+            sessions = [self._row_to_session(row) for row in cursor]
+        self._load_exercises_batch(sessions)
 
         return sessions
 
+    def get_completed(
+        self,
+        limit: int = 50,
+        before: Optional[tuple[datetime, UUID]] = None,
+    ) -> list[SessionSummary]:
+        """
+        Get summaries of ended sessions, newest first.
+
+        Pages are read with a keyset on (started_at, id) rather than OFFSET,
+        so each page costs the same however far back it is, and sessions
+        sharing a start time are neither skipped nor repeated.
+
+        Args:
+            limit: Maximum number of sessions to return
+            before: Only return sessions ordered after this (started_at, id)
+                pair; pass the last session of the previous page to continue
+
+        Returns:
+            Session summaries with totals computed in SQL
+        """
+        self.flush_pending_sets()
+        before_started_at, before_id = (before[0], before[1].bytes) if before else (None, None)
+        rows = self.db.execute(
+            f"""
+            SELECT {_SUMMARY_COLUMNS}
+            FROM (
+                SELECT id, template_name, started_at, ended_at, duration_seconds
+                FROM workout_sessions
+                WHERE ended_at IS NOT NULL
+                  AND (?1 IS NULL OR (started_at, id) < (?1, ?2))
+                ORDER BY started_at DESC, id DESC
+                LIMIT ?3
+            ) ws
+            {_SUMMARY_JOINS}
+            GROUP BY ws.id
+            ORDER BY ws.started_at DESC, ws.id DESC
+            """,
+            (before_started_at, before_id, limit),
+        )
+        return [self._row_to_summary(row) for row in rows]
+
+    def get_since(self, started_at: datetime) -> list[SessionSummary]:
+        """
+        Get summaries of sessions started at or after a time, newest first.
+
+        Args:
+            started_at: Earliest start time to include
+
+        Returns:
+            Session summaries with totals computed in SQL
+        """
+        self.flush_pending_sets()
+        rows = self.db.execute(
+            f"""
+            SELECT {_SUMMARY_COLUMNS}
+            FROM workout_sessions ws
+            {_SUMMARY_JOINS}
+            WHERE ws.started_at >= ?
+            GROUP BY ws.id
+            ORDER BY ws.started_at DESC
+            """,
+            (started_at,),
+        )
+        return [self._row_to_summary(row) for row in rows]
+
+    def _row_to_summary(self, row) -> SessionSummary:  # noqa: ANN001
+        """Convert a _SUMMARY_COLUMNS row to a SessionSummary."""
+        return SessionSummary(
+            id=UUID(bytes=row["id"]),
+            template_name=row["template_name"],
+            started_at=row["started_at"],
+            ended_at=row["ended_at"],
+            duration_seconds=row["duration_seconds"],
+            exercise_count=row["exercise_count"],
+            total_sets=row["total_sets"],
+            total_reps=row["total_reps"],
+            total_volume=row["total_volume"],
+        )
+
     def get_by_id(self, session_id: UUID) -> Optional[WorkoutSession]:
         """Get a session by ID with all exercises and sets."""
+        self.flush_pending_sets()
         with self.db.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT id, template_id, template_name, started_at, ended_at,
-                       duration_seconds, notes
-                FROM workout_sessions
-                WHERE id = ?
-                """,
-                (str(session_id),),
-            )
+            cursor.execute(_SESSION_BY_ID_SQL, (session_id.bytes,))
             row = cursor.fetchone()
             if row is None:
                 return None
 
             session = self._row_to_session(row)
-            self._load_exercises(cursor, session)
-            return session
+        self._load_exercises(session)
+        return session
 
-    def get_active(self) -> Optional[WorkoutSession]:
-        """Get the current active session (if any)."""
-        with self.db.cursor() as cursor:
+    def get_by_id_full(self, session_id: UUID) -> Optional[WorkoutSession]:
+        """
+        Get a session by ID with all exercises and sets in one query.
+
+        get_by_id reads the session row and then its exercises and sets with
+        two batched queries; this joins everything into one query and
+        rebuilds the object graph from the rows.
+
+        Args:
+            session_id: ID of the session
+
+        Returns:
+            The session with its exercises and sets, or None if not found
+        """
+        self.flush_pending_sets()
+        with self.db.tuple_cursor() as cursor:
             cursor.execute(
                 """
-                SELECT id, template_id, template_name, started_at, ended_at,
-                       duration_seconds, notes
-                FROM workout_sessions
-                WHERE ended_at IS NULL
-                ORDER BY started_at DESC
-                LIMIT 1
-                """
+                SELECT ws.id, ws.template_id, ws.template_name, ws.started_at,
+                       ws.ended_at, ws.duration_seconds, ws.notes,
+                       se.id, se.name, se.order_index, se.uses_weight,
+                       s.id, s.reps, s.weight, s.created_at
+                FROM workout_sessions ws
+                LEFT JOIN session_exercises se ON se.session_id = ws.id
+                LEFT JOIN sets s ON s.session_exercise_id = se.id
+                WHERE ws.id = ?
+                ORDER BY se.order_index, se.id, s.created_at
+                """,
+                (session_id.bytes,),
             )
+            rows = cursor.fetchall()
+        if not rows:
+            return None
+
+        ws_id, template_id, template_name, started_at, ended_at, duration, notes = rows[0][:7]
+        session = WorkoutSession(
+            id=UUID(bytes=ws_id),
+            template_id=UUID(bytes=template_id) if template_id else None,
+            template_name=template_name,
+            started_at=started_at,
+            ended_at=ended_at,
+            duration_seconds=duration,
+            notes=notes,
+            exercises=[],
+        )
+        exercise: Optional[SessionExercise] = None
+        for row in rows:
+            exercise_id, name, order_index, uses_weight, set_id, reps, weight, created_at = row[7:]
+            if exercise_id is None:
+                break  # Session has no exercises
+
+            if exercise is None or exercise.id.bytes != exercise_id:
+                exercise = SessionExercise(
+                    id=UUID(bytes=exercise_id),
+                    session_id=session.id,
+                    name=name,
+                    order_index=order_index,
+                    uses_weight=bool(uses_weight),
+                    sets=[],
+                )
+                session.exercises.append(exercise)
+
+            if set_id is not None:
+                exercise.sets.append(
+                    Set(
+                        id=UUID(bytes=set_id),
+                        session_exercise_id=exercise.id,
+                        reps=reps,
+                        weight=weight,
+                        created_at=created_at,
+                    )
+                )
+
+        return session
+
+    def get_active(self) -> Optional[WorkoutSession]:
+        """Get the current active session (if any)."""
+        self.flush_pending_sets()
+        with self.db.cursor() as cursor:
+            cursor.execute(_ACTIVE_SESSION_SQL)
             row = cursor.fetchone()
             if row is None:
                 return None
 
             session = self._row_to_session(row)
-            self._load_exercises(cursor, session)
-            return session
+        self._load_exercises(session)
+        return session
 
     def _row_to_session(self, row) -> WorkoutSession:  # noqa: ANN001
         """Convert a database row to a WorkoutSession."""
         return WorkoutSession(
-            id=UUID(row["id"]),
-            template_id=UUID(row["template_id"]) if row["template_id"] else None,
+            id=UUID(bytes=row["id"]),
+            template_id=UUID(bytes=row["template_id"]) if row["template_id"] else None,
             template_name=row["template_name"],
             started_at=row["started_at"],
             ended_at=row["ended_at"],
@@ -254,168 +539,257 @@ class SessionRepository:
             exercises=[],
         )
 
-    def _load_exercises(self, cursor, session: WorkoutSession) -> None:  # noqa: ANN001
-        """Load exercises and sets for a session."""
-        cursor.execute(
-            """
-            SELECT id, session_id, name, order_index, uses_weight
-            FROM session_exercises
-            WHERE session_id = ?
-            ORDER BY order_index
-            """,
-            (str(session.id),),
+    def get_exercise_by_id(self, exercise_id: UUID) -> Optional[SessionExercise]:
+        """Get a single session exercise with its sets."""
+        self.flush_pending_sets()
+        with self.db.cursor() as cursor:
+            cursor.execute(_EXERCISE_BY_ID_SQL, (exercise_id.bytes,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+
+            exercise = self._row_to_exercise(row)
+        self._load_sets(exercise)
+        return exercise
+
+    def _row_to_exercise(self, row) -> SessionExercise:  # noqa: ANN001
+        """Convert a database row to a SessionExercise."""
+        return SessionExercise(
+            id=UUID(bytes=row["id"]),
+            session_id=UUID(bytes=row["session_id"]),
+            name=row["name"],
+            order_index=row["order_index"],
+            uses_weight=bool(row["uses_weight"]),
+            sets=[],
         )
 
-        for ex_row in cursor.fetchall():
-            exercise = SessionExercise(
-                id=UUID(ex_row["id"]),
-                session_id=UUID(ex_row["session_id"]),
-                name=ex_row["name"],
-                order_index=ex_row["order_index"],
-                uses_weight=bool(ex_row["uses_weight"]),
-                sets=[],
-            )
+    def _load_exercises(self, session: WorkoutSession) -> None:
+        """Load exercises and sets for a session."""
+        self._load_exercises_batch([session])
 
-            # Load sets for this exercise
+    def _load_exercises_batch(self, sessions: list[WorkoutSession]) -> None:
+        """
+        Load exercises and sets for several sessions with two queries.
+
+        Rows come back as plain tuples and are unpacked by position.
+
+        Args:
+            sessions: Sessions to fill in, each with no exercises loaded yet
+        """
+        if not sessions:
+            return
+
+        sessions_by_id = {session.id.bytes: session for session in sessions}
+        placeholders = ", ".join("?" * len(sessions_by_id))
+        session_ids = tuple(sessions_by_id)
+
+        with self.db.tuple_cursor() as cursor:
             cursor.execute(
-                """
-                SELECT id, session_exercise_id, reps, weight, created_at
-                FROM sets
-                WHERE session_exercise_id = ?
-                ORDER BY created_at
+                f"""
+                SELECT id, session_id, name, order_index, uses_weight
+                FROM session_exercises
+                WHERE session_id IN ({placeholders})
+                ORDER BY session_id, order_index
                 """,
-                (str(exercise.id),),
+                session_ids,
             )
+            exercises_by_id: dict[bytes, SessionExercise] = {}
+            for exercise_id, session_id, name, order_index, uses_weight in cursor:
+                session = sessions_by_id[session_id]
+                exercise = SessionExercise(
+                    id=UUID(bytes=exercise_id),
+                    session_id=session.id,
+                    name=name,
+                    order_index=order_index,
+                    uses_weight=bool(uses_weight),
+                    sets=[],
+                )
+                session.exercises.append(exercise)
+                exercises_by_id[exercise_id] = exercise
 
-            for set_row in cursor.fetchall():
+            if not exercises_by_id:
+                return
+
+            cursor.execute(
+                f"""
+                SELECT s.id, s.session_exercise_id, s.reps, s.weight, s.created_at
+                FROM sets s
+                JOIN session_exercises se ON se.id = s.session_exercise_id
+                WHERE se.session_id IN ({placeholders})
+                ORDER BY s.session_exercise_id, s.created_at
+                """,
+                session_ids,
+            )
+            for set_id, exercise_id, reps, weight, created_at in cursor:
+                exercise = exercises_by_id[exercise_id]
                 exercise.sets.append(
                     Set(
-                        id=UUID(set_row["id"]),
-                        session_exercise_id=UUID(set_row["session_exercise_id"]),
-                        reps=set_row["reps"],
-                        weight=set_row["weight"],
-                        created_at=set_row["created_at"],
+                        id=UUID(bytes=set_id),
+                        session_exercise_id=exercise.id,
+                        reps=reps,
+                        weight=weight,
+                        created_at=created_at,
                     )
                 )
 
-            session.exercises.append(exercise)
+    def _load_sets(self, exercise: SessionExercise) -> None:
+        """Load sets for an exercise."""
+        with self.db.tuple_cursor() as cursor:
+            cursor.execute(_EXERCISE_SETS_SQL, (exercise.id.bytes,))
+
+            for set_id, reps, weight, created_at in cursor:
+                exercise.sets.append(
+                    Set(
+                        id=UUID(bytes=set_id),
+                        session_exercise_id=exercise.id,
+                        reps=reps,
+                        weight=weight,
+                        created_at=created_at,
+                    )
+                )
 
     def save(self, session: WorkoutSession) -> None:
         """Save a session (insert or update)."""
+        self.version += 1
+        self.db.execute(_UPSERT_SESSION_SQL, _session_params(session))
+
+    def save_with_exercises(self, session: WorkoutSession) -> None:
+        """
+        Save a session and all of its exercises in one transaction.
+
+        The session row is written first, so its exercises' foreign keys
+        are satisfied.
+
+        Args:
+            session: Session whose exercises should be saved with it
+        """
+        self.version += 1
         with self.db.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO workout_sessions
-                    (id, template_id, template_name, started_at, ended_at, duration_seconds, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    template_id = excluded.template_id,
-                    template_name = excluded.template_name,
-                    ended_at = excluded.ended_at,
-                    duration_seconds = excluded.duration_seconds,
-                    notes = excluded.notes
-                """,
-                (
-                    str(session.id),
-                    str(session.template_id) if session.template_id else None,
-                    session.template_name,
-                    session.started_at,
-                    session.ended_at,
-                    session.duration_seconds,
-                    session.notes,
-                ),
+            cursor.execute(_UPSERT_SESSION_SQL, _session_params(session))
+            cursor.executemany(
+                _UPSERT_SESSION_EXERCISE_SQL,
+                [_session_exercise_params(ex) for ex in session.exercises],
             )
 
     def save_exercise(self, exercise: SessionExercise) -> None:
         """Save an exercise within a session."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO session_exercises (id, session_id, name, order_index, uses_weight)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    name = excluded.name,
-                    order_index = excluded.order_index,
-                    uses_weight = excluded.uses_weight
-                """,
-                (
-                    str(exercise.id),
-                    str(exercise.session_id),
-                    exercise.name,
-                    exercise.order_index,
-                    1 if exercise.uses_weight else 0,
-                ),
-            )
+        self.version += 1
+        self.db.execute(_UPSERT_SESSION_EXERCISE_SQL, _session_exercise_params(exercise))
 
     def delete_exercise(self, exercise_id: UUID) -> None:
         """Delete an exercise from a session."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                "DELETE FROM session_exercises WHERE id = ?",
-                (str(exercise_id),),
-            )
+        self.version += 1
+        self.flush_pending_sets()
+        self.db.execute(
+            "DELETE FROM session_exercises WHERE id = ?",
+            (exercise_id.bytes,),
+        )
 
     def save_set(self, workout_set: Set) -> None:
         """Save a set within an exercise."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO sets (id, session_exercise_id, reps, weight, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    reps = excluded.reps,
-                    weight = excluded.weight
-                """,
-                (
-                    str(workout_set.id),
-                    str(workout_set.session_exercise_id),
-                    workout_set.reps,
-                    workout_set.weight,
-                    workout_set.created_at,
-                ),
-            )
+        self.save_sets([workout_set])
+
+    def save_sets(self, sets: list[Set]) -> None:
+        """
+        Save several sets, along with any queued ones, in one transaction.
+
+        Args:
+            sets: Sets to save
+        """
+        self.version += 1
+        self._pending_sets.extend(sets)
+        self.flush_pending_sets()
+
+    def save_set_deferred(self, workout_set: Set) -> None:
+        """
+        Queue a set to be saved with the next flush.
+
+        Sets logged in quick succession are then written in one
+        transaction instead of one commit each. Every method of this
+        repository that reads or deletes sets flushes the queue first, so
+        callers always see queued sets.
+
+        Args:
+            workout_set: Set to save
+        """
+        self.version += 1
+        self._pending_sets.append(workout_set)
+
+    def mark_changed(self) -> None:
+        """Record a change to session data made outside this repository."""
+        self.version += 1
+
+    def flush_pending_sets(self) -> None:
+        """
+        Write all queued sets in a single transaction.
+
+        The queue is only emptied once the transaction commits, so sets
+        from a failed write are retried by the next flush.
+
+        Raises:
+            sqlite3.Error: If the sets could not be written
+        """
+        if not self._pending_sets:
+            return
+        self.db.bulk_insert(_UPSERT_SET_SQL, [_set_params(s) for s in self._pending_sets])
+        self._pending_sets = []
+
+    def discard_pending_sets(self) -> None:
+        """Drop queued sets without writing them, e.g. when all data is reset."""
+        self._pending_sets = []
 
     def delete_set(self, set_id: UUID) -> None:
         """Delete a set."""
-        with self.db.transaction() as cursor:
-            cursor.execute("DELETE FROM sets WHERE id = ?", (str(set_id),))
+        self.version += 1
+        self.flush_pending_sets()
+        self.db.execute("DELETE FROM sets WHERE id = ?", (set_id.bytes,))
 
     def end_session(self, session_id: UUID, duration_seconds: int) -> None:
-        """Mark a session as ended."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                """
-                UPDATE workout_sessions
-                SET ended_at = ?, duration_seconds = ?
-                WHERE id = ?
-                """,
-                (datetime.now(), duration_seconds, str(session_id)),
-            )
+        """
+        Mark a session as ended.
+
+        SQLite stamps the end time itself, in local time with millisecond
+        precision to match the Python-written timestamps.
+
+        Args:
+            session_id: ID of the session to end
+            duration_seconds: Active workout time, excluding pauses
+        """
+        self.version += 1
+        self.db.execute(
+            """
+            UPDATE workout_sessions
+            SET ended_at = strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime'),
+                duration_seconds = ?
+            WHERE id = ?
+            """,
+            (duration_seconds, session_id.bytes),
+        )
 
     def delete(self, session_id: UUID) -> None:
         """Delete a session."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                "DELETE FROM workout_sessions WHERE id = ?",
-                (str(session_id),),
-            )
+        self.version += 1
+        self.flush_pending_sets()
+        self.db.execute(
+            "DELETE FROM workout_sessions WHERE id = ?",
+            (session_id.bytes,),
+        )
 
     def get_last_weight_for_exercise(self, exercise_name: str) -> Optional[float]:
         """Get the last used weight for an exercise across all sessions."""
-        with self.db.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT s.weight
-                FROM sets s
-                JOIN session_exercises se ON s.session_exercise_id = se.id
-                WHERE se.name = ? AND s.weight IS NOT NULL
-                ORDER BY s.created_at DESC
-                LIMIT 1
-                """,
-                (exercise_name,),
-            )
-            row = cursor.fetchone()
-            return row["weight"] if row else None
+        self.flush_pending_sets()
+        row = self.db.execute(
+            """
+            SELECT s.weight
+            FROM sets s
+            JOIN session_exercises se ON s.session_exercise_id = se.id
+            WHERE se.name = ? AND s.weight IS NOT NULL
+            ORDER BY s.created_at DESC
+            LIMIT 1
+            """,
+            (exercise_name,),
+        ).fetchone()
+        return row["weight"] if row else None
 
 
 class AppStateRepository:
@@ -423,30 +797,63 @@ class AppStateRepository:
 
     def __init__(self, db: Database) -> None:
         self.db = db
+        # Bumped by every write, so views can tell when cached content is stale
+        self.version = 0
+        # Values read or written so far, None for keys known to be absent
+        self._cache: dict[str, Optional[str]] = {}
+        # Last timer_state JSON seen and the TimerState it decodes to
+        self._timer_cache: Optional[tuple[str, TimerState]] = None
 
     def get(self, key: str) -> Optional[str]:
         """Get a state value by key."""
-        with self.db.cursor() as cursor:
-            cursor.execute("SELECT value FROM app_state WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            return row["value"] if row else None
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        row = self.db.execute("SELECT value FROM app_state WHERE key = ?", (key,)).fetchone()
+        value = self._cache[key] = row["value"] if row else None
+        return value
 
     def set(self, key: str, value: str) -> None:
         """Set a state value."""
-        with self.db.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO app_state (key, value)
-                VALUES (?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value
-                """,
-                (key, value),
-            )
+        self.version += 1
+        self.db.execute(
+            """
+            INSERT INTO app_state (key, value)
+            VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (key, value),
+        )
+        self._cache[key] = value
 
     def delete(self, key: str) -> None:
         """Delete a state value."""
-        with self.db.transaction() as cursor:
-            cursor.execute("DELETE FROM app_state WHERE key = ?", (key,))
+        self.version += 1
+        self.db.execute("DELETE FROM app_state WHERE key = ?", (key,))
+        self._cache[key] = None
+
+    def _set_or_delete(self, key: str, value: Optional[str]) -> None:
+        """
+        Set a state value, or delete it if value is None.
+
+        Nothing is written when the key is cached with the same value.
+
+        Args:
+            key: State key
+            value: New value, or None to remove the key
+        """
+        if key in self._cache and self._cache[key] == value:
+            return
+        if value is None:
+            self.delete(key)
+        else:
+            self.set(key, value)
+
+    def mark_changed(self) -> None:
+        """Record a change to app state made outside this repository."""
+        self.version += 1
+        self._cache.clear()
 
     def get_active_session_id(self) -> Optional[UUID]:
         """Get the active session ID."""
@@ -455,10 +862,7 @@ class AppStateRepository:
 
     def set_active_session_id(self, session_id: Optional[UUID]) -> None:
         """Set the active session ID."""
-        if session_id is None:
-            self.delete("active_session_id")
-        else:
-            self.set("active_session_id", str(session_id))
+        self._set_or_delete("active_session_id", str(session_id) if session_id else None)
 
     def get_last_template_id(self) -> Optional[UUID]:
         """Get the last used template ID."""
@@ -467,41 +871,39 @@ class AppStateRepository:
 
     def set_last_template_id(self, template_id: Optional[UUID]) -> None:
         """Set the last used template ID."""
-        if template_id is None:
-            self.delete("last_template_id")
-        else:
-            self.set("last_template_id", str(template_id))
+        self._set_or_delete("last_template_id", str(template_id) if template_id else None)
 
     def get_timer_state(self) -> Optional[TimerState]:
         """Get the persisted timer state."""
         value = self.get("timer_state")
         if value is None:
             return None
+        if self._timer_cache is not None and self._timer_cache[0] == value:
+            return self._timer_cache[1]
 
         try:
-            data = json.loads(value)
-            return TimerState(
+            data = orjson.loads(value) if _HAS_ORJSON else json.loads(value)
+            state = TimerState(
                 is_running=data["is_running"],
                 is_paused=data["is_paused"],
                 start_time=(
-                    datetime.fromisoformat(data["start_time"])
-                    if data["start_time"]
-                    else None
+                    datetime.fromisoformat(data["start_time"]) if data["start_time"] else None
                 ),
                 pause_time=(
-                    datetime.fromisoformat(data["pause_time"])
-                    if data["pause_time"]
-                    else None
+                    datetime.fromisoformat(data["pause_time"]) if data["pause_time"] else None
                 ),
                 accumulated_seconds=data["accumulated_seconds"],
             )
         except (json.JSONDecodeError, KeyError):
             return None
 
+        self._timer_cache = (value, state)
+        return state
+
     def set_timer_state(self, state: Optional[TimerState]) -> None:
         """Set the timer state."""
         if state is None:
-            self.delete("timer_state")
+            self._set_or_delete("timer_state", None)
         else:
             data = {
                 "is_running": state.is_running,
@@ -510,9 +912,14 @@ class AppStateRepository:
                 "pause_time": state.pause_time.isoformat() if state.pause_time else None,
                 "accumulated_seconds": state.accumulated_seconds,
             }
-            self.set("timer_state", json.dumps(data))
+            value = orjson.dumps(data).decode() if _HAS_ORJSON else json.dumps(data)
+            self._set_or_delete("timer_state", value)
+            # Timer code replaces TimerState objects rather than mutating them,
+            # so the caller's instance can be handed back by get_timer_state
+            self._timer_cache = (value, state)
 
     def clear_all(self) -> None:
         """Clear all app state (for reset)."""
-        with self.db.transaction() as cursor:
-            cursor.execute("DELETE FROM app_state")
+        self.version += 1
+        self.db.execute("DELETE FROM app_state")
+        self._cache.clear()
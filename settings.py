@@ -318,8 +318,13 @@ def _create_danger_zone(app: "IronLogApp") -> toga.Box:
 def _reset_all_data(app: "IronLogApp") -> None:
     """Reset all app data."""
     try:
+        # Queued sets belong to exercises that are about to be deleted
+        app.session_repo.discard_pending_sets()
         app.db.reset()
         app.db.initialize()
+        app.session_repo.mark_changed()
+        app.template_repo.mark_changed()
+        app.state_repo.mark_changed()
 
         # Show success
         async def show_success(dialog_app: toga.App) -> None:
@@ -473,12 +473,10 @@ class TemplateEditView:
         )
 
         # Add exercises from template
-        for tex in self.template.exercises:
-            ex = SessionExercise.from_template_exercise(session.id, tex)
-            session.exercises.append(ex)
-            self.app.session_repo.save_exercise(ex)
-
-        self.app.session_repo.save(session)
+        session.exercises = SessionExercise.from_template_exercises(
+            session.id, self.template.exercises
+        )
+        self.app.session_repo.save_with_exercises(session)
         self.app.state_repo.set_active_session_id(session.id)
         self.app.state_repo.set_last_template_id(self.template.id)
         self.app.navigate_to_session(session.id)
@@ -124,6 +124,23 @@ class TestSessionToDict:
         pullup_sets = data["exercises"][1]["sets"]
         assert pullup_sets[0]["weight"] is None
 
+    def test_reflects_in_place_edits(self, sample_session):
+        """Should pick up edits made to a session between conversions."""
+        session_to_dict(sample_session)
+
+        bench = sample_session.exercises[0]
+        bench.name = "Incline Bench Press"
+        bench.sets[0].reps = 12
+        bench.sets[1].weight = 150.0
+        sample_session.duration_seconds = 6000
+
+        data = session_to_dict(sample_session)
+        assert data["exercises"][0]["name"] == "Incline Bench Press"
+        assert data["exercises"][0]["sets"][0]["reps"] == 12
+        assert data["duration_seconds"] == 6000
+        assert data["summary"]["total_reps"] == 30  # 12 + 8 + 10
+        assert data["summary"]["total_volume"] == 2820.0  # 135*12 + 150*8
+
 
 class TestExportJson:
     """Test cases for JSON export."""
@@ -136,6 +153,14 @@ class TestExportJson:
         assert data["template_name"] == "Push Day"
         assert len(data["exercises"]) == 2
 
+    def test_timestamps_iso_formatted(self, sample_session):
+        """Should write timestamps as ISO 8601 strings."""
+        data = json.loads(export_session_json_string(sample_session))
+
+        assert data["started_at"] == "2024-01-15T10:00:00"
+        assert data["ended_at"] == "2024-01-15T11:30:00"
+        assert data["exercises"][0]["sets"][0]["created_at"] == "2024-01-15T10:05:00"
+
     def test_export_json_file(self, sample_session):
         """Should export to JSON file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,9 +1,10 @@
 """Tests for repository classes."""
 
+import sqlite3
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -15,6 +16,7 @@ from app.core.models import (
     WorkoutSession,
     WorkoutTemplate,
 )
+from app.data import migrations
 from app.data.db import Database
 from app.data.repositories import (
     AppStateRepository,
@@ -64,6 +66,17 @@ class TestTemplateRepository:
         assert "Pull Day" in names
         assert "Leg Day" in names
 
+    def test_get_all_matches_get_by_id(self, template_repo):
+        """Should load the same templates and exercises as get_by_id."""
+        empty = WorkoutTemplate.create("Empty")
+        template_repo.save(empty)
+
+        templates = template_repo.get_all()
+        assert [t.name for t in templates] == sorted(t.name for t in templates)
+        for template in templates:
+            assert template == template_repo.get_by_id(template.id)
+        assert next(t for t in templates if t.id == empty.id).exercises == []
+
     def test_create_template(self, template_repo):
         """Should create a new template."""
         template = WorkoutTemplate.create("My Template")
@@ -99,6 +112,44 @@ class TestTemplateRepository:
         loaded = template_repo.get_by_id(template.id)
         assert loaded.name == "Updated"
 
+    def test_save_loaded_template_changes(self, template_repo):
+        """Should persist renames and in-place exercise edits of a loaded template."""
+        template = WorkoutTemplate.create("Legs")
+        template.exercises = [
+            TemplateExercise.create(template.id, "Squats", 0),
+            TemplateExercise.create(template.id, "Lunges", 1),
+        ]
+        template_repo.save(template)
+
+        loaded = template_repo.get_by_id(template.id)
+        loaded.name = "Leg Day"
+        template_repo.save(loaded)
+        assert [ex.name for ex in template_repo.get_by_id(template.id).exercises] == [
+            "Squats",
+            "Lunges",
+        ]
+
+        loaded.exercises.reverse()
+        for i, ex in enumerate(loaded.exercises):
+            ex.order_index = i
+        template_repo.save(loaded)
+
+        reloaded = template_repo.get_by_id(template.id)
+        assert reloaded.name == "Leg Day"
+        assert [ex.name for ex in reloaded.exercises] == ["Lunges", "Squats"]
+
+    def test_save_recreates_deleted_template(self, template_repo):
+        """Should write the whole template again if it was deleted after loading."""
+        template = WorkoutTemplate.create("Arms")
+        template.exercises = [TemplateExercise.create(template.id, "Curls", 0)]
+        template_repo.save(template)
+
+        template_repo.delete(template.id)
+        template_repo.save(template)
+
+        loaded = template_repo.get_by_id(template.id)
+        assert [ex.name for ex in loaded.exercises] == ["Curls"]
+
     def test_delete_template(self, template_repo):
         """Should delete a template."""
         template = WorkoutTemplate.create("To Delete")
@@ -124,6 +175,23 @@ class TestTemplateRepository:
         assert copy.name == "Copy"
         assert len(copy.exercises) == 1
         assert copy.exercises[0].name == "Exercise 1"
+        assert template_repo.get_by_id(copy.id) == copy
+
+    def test_duplicate_missing_template(self, template_repo):
+        """Should return None when the original does not exist."""
+        assert template_repo.duplicate(uuid4(), "Copy") is None
+
+    def test_version_bumped_on_write(self, template_repo):
+        """Should bump the version on every write, but not on reads."""
+        template = WorkoutTemplate.create("Versioned")
+        template_repo.save(template)
+        version = template_repo.version
+
+        template_repo.get_all()
+        assert template_repo.version == version
+
+        template_repo.delete(template.id)
+        assert template_repo.version > version
 
 
 class TestSessionRepository:
@@ -150,6 +218,19 @@ class TestSessionRepository:
         assert len(loaded.exercises) == 1
         assert loaded.exercises[0].name == "Deadlift"
 
+    def test_save_with_exercises(self, session_repo):
+        """Should save a session and its exercises together."""
+        session = WorkoutSession.create(template_name="Leg Day")
+        session.exercises = [
+            SessionExercise.create(session.id, "Squats", 0, True),
+            SessionExercise.create(session.id, "Lunges", 1, False),
+        ]
+        session_repo.save_with_exercises(session)
+
+        loaded = session_repo.get_by_id(session.id)
+        assert loaded.template_name == "Leg Day"
+        assert [ex.name for ex in loaded.exercises] == ["Squats", "Lunges"]
+
     def test_session_with_sets(self, session_repo):
         """Should save exercises with sets."""
         session = WorkoutSession.create()
@@ -168,6 +249,132 @@ class TestSessionRepository:
         assert loaded.exercises[0].sets[0].reps == 10
         assert loaded.exercises[0].sets[1].weight == 145.0
 
+    def test_get_by_id_full_matches_get_by_id(self, session_repo):
+        """Should load the same object graph as get_by_id."""
+        session = WorkoutSession.create(template_name="Push Day")
+        session_repo.save(session)
+
+        bench = SessionExercise.create(session.id, "Bench Press", 0, True)
+        dips = SessionExercise.create(session.id, "Dips", 1, False)
+        empty = SessionExercise.create(session.id, "Flyes", 2, True)
+        for exercise in (bench, dips, empty):
+            session_repo.save_exercise(exercise)
+        session_repo.save_set(Set.create(bench.id, reps=10, weight=135.0))
+        session_repo.save_set(Set.create(bench.id, reps=8, weight=145.0))
+        session_repo.save_set(Set.create(dips.id, reps=12))
+
+        loaded = session_repo.get_by_id_full(session.id)
+        assert loaded == session_repo.get_by_id(session.id)
+        assert [len(ex.sets) for ex in loaded.exercises] == [2, 1, 0]
+        assert isinstance(loaded.exercises[0].sets[0].created_at, datetime)
+
+    def test_get_all_loads_each_session(self, session_repo):
+        """Should attach exercises and sets to the right sessions."""
+        sessions = [WorkoutSession.create(template_name=name) for name in ("A", "B", "C")]
+        for i, session in enumerate(sessions):
+            session.started_at -= timedelta(hours=i)
+            session_repo.save(session)
+            for order_index in range(i):
+                exercise = SessionExercise.create(session.id, f"Ex {order_index}", order_index)
+                session_repo.save_exercise(exercise)
+                session_repo.save_set(Set.create(exercise.id, reps=5, weight=100.0))
+
+        loaded = session_repo.get_all()
+        assert [s.template_name for s in loaded] == ["A", "B", "C"]
+        for session in loaded:
+            assert session == session_repo.get_by_id(session.id)
+        assert [len(s.exercises) for s in loaded] == [0, 1, 2]
+
+    def test_get_by_id_full_without_exercises(self, session_repo):
+        """Should load a session that has no exercises."""
+        session = WorkoutSession.create()
+        session_repo.save(session)
+
+        loaded = session_repo.get_by_id_full(session.id)
+        assert loaded is not None
+        assert loaded.exercises == []
+        assert session_repo.get_by_id_full(uuid4()) is None
+
+    def test_get_exercise_by_id(self, session_repo):
+        """Should load a single exercise with its sets."""
+        session = WorkoutSession.create()
+        session_repo.save(session)
+
+        exercise = SessionExercise.create(session.id, "Rows", 0, True)
+        session_repo.save_exercise(exercise)
+        session_repo.save_set(Set.create(exercise.id, reps=10, weight=95.0))
+
+        loaded = session_repo.get_exercise_by_id(exercise.id)
+        assert loaded is not None
+        assert loaded.session_id == session.id
+        assert loaded.name == "Rows"
+        assert len(loaded.sets) == 1
+        assert loaded.sets[0].weight == 95.0
+
+        assert session_repo.get_exercise_by_id(uuid4()) is None
+
+    def test_save_set_deferred(self, db, session_repo):
+        """Queued sets should be written together before the next read."""
+        session = WorkoutSession.create()
+        session_repo.save(session)
+
+        exercise = SessionExercise.create(session.id, "Dips", 0, False)
+        session_repo.save_exercise(exercise)
+
+        session_repo.save_set_deferred(Set.create(exercise.id, reps=12))
+        session_repo.save_set_deferred(Set.create(exercise.id, reps=10))
+        assert db.execute("SELECT COUNT(*) FROM sets").fetchone()[0] == 0
+
+        loaded = session_repo.get_exercise_by_id(exercise.id)
+        assert [s.reps for s in loaded.sets] == [12, 10]
+
+    def test_save_sets(self, db, session_repo):
+        """Should write the given sets together with any queued ones."""
+        session = WorkoutSession.create()
+        session_repo.save(session)
+
+        exercise = SessionExercise.create(session.id, "Squats", 0, True)
+        session_repo.save_exercise(exercise)
+
+        session_repo.save_set_deferred(Set.create(exercise.id, reps=5, weight=225.0))
+        session_repo.save_sets(
+            [
+                Set.create(exercise.id, reps=5, weight=235.0),
+                Set.create(exercise.id, reps=3, weight=245.0),
+            ]
+        )
+        assert db.execute("SELECT COUNT(*) FROM sets").fetchone()[0] == 3
+
+    def test_failed_flush_keeps_queued_sets(self, db, session_repo):
+        """Should keep queued sets after a failed write and save them on retry."""
+        session = WorkoutSession.create()
+        exercise = SessionExercise.create(session.id, "Squats", 0, True)
+        # The exercise doesn't exist yet, so the foreign key check fails
+        session_repo.save_set_deferred(Set.create(exercise.id, reps=5, weight=225.0))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            session_repo.flush_pending_sets()
+        assert db.execute("SELECT COUNT(*) FROM sets").fetchone()[0] == 0
+
+        session_repo.save(session)
+        session_repo.save_exercise(exercise)
+        session_repo.flush_pending_sets()
+        assert db.execute("SELECT COUNT(*) FROM sets").fetchone()[0] == 1
+
+    def test_discard_pending_sets(self, db, session_repo):
+        """Should drop queued sets, as on a data reset, without writing them."""
+        session = WorkoutSession.create()
+        session_repo.save(session)
+        exercise = SessionExercise.create(session.id, "Squats", 0, True)
+        session_repo.save_exercise(exercise)
+        session_repo.save_set_deferred(Set.create(exercise.id, reps=5, weight=225.0))
+
+        session_repo.discard_pending_sets()
+        db.reset()
+
+        session_repo.flush_pending_sets()
+        assert db.execute("SELECT COUNT(*) FROM sets").fetchone()[0] == 0
+
     def test_end_session(self, session_repo):
         """Should end a session."""
         session = WorkoutSession.create()
@@ -180,6 +387,16 @@ class TestSessionRepository:
         assert loaded.duration_seconds == 3600
         assert not loaded.is_active
 
+    def test_end_session_stamps_local_time(self, session_repo):
+        """Should record the end time in local time, like the start time."""
+        session = WorkoutSession.create()
+        session_repo.save(session)
+
+        session_repo.end_session(session.id, 60)
+
+        loaded = session_repo.get_by_id(session.id)
+        assert abs(loaded.ended_at - datetime.now()) < timedelta(minutes=1)
+
     def test_get_active_session(self, session_repo):
         """Should get active session."""
         # Create an active session
@@ -196,6 +413,83 @@ class TestSessionRepository:
         assert result is not None
         assert result.id == active.id
 
+    def test_get_completed_pages(self, session_repo):
+        """Should page through ended sessions newest first."""
+        base = datetime(2024, 1, 1, 9, 0, 0)
+        ended = []
+        for day in range(5):
+            session = WorkoutSession.create()
+            session.started_at = base + timedelta(days=day)
+            session_repo.save(session)
+            session_repo.end_session(session.id, 1800)
+            ended.append(session.id)
+
+        active = WorkoutSession.create()
+        session_repo.save(active)
+
+        first = session_repo.get_completed(limit=3)
+        assert [s.id for s in first] == ended[:1:-1]
+
+        rest = session_repo.get_completed(limit=3, before=(first[-1].started_at, first[-1].id))
+        assert [s.id for s in rest] == ended[1::-1]
+
+    def test_get_completed_pages_through_ties(self, session_repo):
+        """Should neither skip nor repeat sessions sharing a start time."""
+        started_at = datetime(2024, 1, 1, 9, 0, 0)
+        ended = set()
+        for _ in range(5):
+            session = WorkoutSession.create()
+            session.started_at = started_at
+            session_repo.save(session)
+            session_repo.end_session(session.id, 1800)
+            ended.add(session.id)
+
+        first = session_repo.get_completed(limit=2)
+        second = session_repo.get_completed(limit=2, before=(first[-1].started_at, first[-1].id))
+        third = session_repo.get_completed(limit=2, before=(second[-1].started_at, second[-1].id))
+
+        paged = [s.id for s in first + second + third]
+        assert len(paged) == 5
+        assert set(paged) == ended
+
+    def test_get_completed_totals(self, session_repo):
+        """Should compute the same totals as the full session."""
+        session = WorkoutSession.create(template_name="Push Day")
+        session_repo.save(session)
+
+        bench = SessionExercise.create(session.id, "Bench Press", 0, True)
+        dips = SessionExercise.create(session.id, "Dips", 1, False)
+        empty = SessionExercise.create(session.id, "Flyes", 2, True)
+        for exercise in (bench, dips, empty):
+            session_repo.save_exercise(exercise)
+        session_repo.save_set(Set.create(bench.id, reps=10, weight=135.0))
+        session_repo.save_set(Set.create(bench.id, reps=8, weight=145.0))
+        session_repo.save_set(Set.create(dips.id, reps=12))
+        session_repo.end_session(session.id, 3600)
+
+        [summary] = session_repo.get_completed()
+        full = session_repo.get_by_id(session.id)
+        assert summary.template_name == "Push Day"
+        assert isinstance(summary.started_at, datetime)
+        assert summary.exercise_count == 3
+        assert summary.total_sets == full.total_sets == 3
+        assert summary.total_reps == full.total_reps == 30
+        assert summary.total_volume == full.total_volume == 2510.0
+        assert summary.formatted_duration() == full.formatted_duration()
+
+    def test_get_since(self, session_repo):
+        """Should return only sessions started at or after the given time."""
+        old = WorkoutSession.create()
+        old.started_at = datetime(2024, 1, 1, 9, 0, 0)
+        session_repo.save(old)
+
+        recent = WorkoutSession.create()
+        recent.started_at = datetime(2024, 1, 10, 9, 0, 0)
+        session_repo.save(recent)
+
+        result = session_repo.get_since(datetime(2024, 1, 5))
+        assert [s.id for s in result] == [recent.id]
+
     def test_get_last_weight_for_exercise(self, session_repo):
         """Should get last used weight for an exercise."""
         session = WorkoutSession.create()
@@ -280,6 +574,19 @@ class TestAppStateRepository:
         assert loaded.is_paused is False
         assert loaded.accumulated_seconds == 120.5
 
+    def test_timer_state_decoded_once(self, db, state_repo):
+        """Should reuse the decoded timer state until the stored JSON changes."""
+        state_repo.set_timer_state(TimerState.initial())
+
+        # A fresh repository has to decode the stored JSON
+        repo = AppStateRepository(db)
+        loaded = repo.get_timer_state()
+        assert loaded == TimerState.initial()
+        assert repo.get_timer_state() is loaded
+
+        repo.set_timer_state(None)
+        assert repo.get_timer_state() is None
+
     def test_clear_all(self, state_repo):
         """Should clear all state."""
         state_repo.set("key1", "value1")
@@ -289,3 +596,134 @@ class TestAppStateRepository:
 
         assert state_repo.get("key1") is None
         assert state_repo.get("key2") is None
+
+    def test_values_cached_until_marked_changed(self, db, state_repo):
+        """Should serve reads from memory until told of an outside change."""
+        state_repo.set("key", "value")
+        db.execute("DELETE FROM app_state")
+        assert state_repo.get("key") == "value"
+
+        state_repo.mark_changed()
+        assert state_repo.get("key") is None
+
+    def test_version_bumped_on_write(self, state_repo):
+        """Should bump the version on every write, but not on reads."""
+        version = state_repo.version
+        state_repo.get_last_template_id()
+        assert state_repo.version == version
+
+        state_repo.set_last_template_id(uuid4())
+        assert state_repo.version > version
+
+    def test_unchanged_value_not_rewritten(self, state_repo):
+        """Should skip the write when a setter is given the current value."""
+        session_id = uuid4()
+        state_repo.set_active_session_id(session_id)
+        version = state_repo.version
+
+        state_repo.set_active_session_id(session_id)
+        assert state_repo.version == version
+
+        state_repo.set_active_session_id(None)
+        state_repo.set_active_session_id(None)
+        assert state_repo.version == version + 1
+        assert state_repo.get_active_session_id() is None
+
+
+class TestDatabase:
+    """Test cases for Database helpers."""
+
+    def test_bulk_insert(self, db):
+        """Should insert all rows in one call."""
+        rows = [(f"key_{i}", str(i)) for i in range(10)]
+        db.bulk_insert("INSERT INTO app_state (key, value) VALUES (?, ?)", rows)
+
+        count = db.execute("SELECT COUNT(*) FROM app_state").fetchone()[0]
+        assert count == 10
+
+    def test_bulk_insert_rolls_back_on_error(self, db):
+        """A failing row should roll back the whole batch."""
+        rows = [("dup", "1"), ("other", "2"), ("dup", "3")]
+        with pytest.raises(sqlite3.IntegrityError):
+            db.bulk_insert("INSERT INTO app_state (key, value) VALUES (?, ?)", rows)
+
+        count = db.execute("SELECT COUNT(*) FROM app_state").fetchone()[0]
+        assert count == 0
+
+    def test_bulk_update(self, db):
+        """Should update every matching row."""
+        db.bulk_insert(
+            "INSERT INTO app_state (key, value) VALUES (?, ?)",
+            [("a", "1"), ("b", "2")],
+        )
+        db.bulk_update(
+            "UPDATE app_state SET value = ? WHERE key = ?",
+            [("10", "a"), ("20", "b")],
+        )
+
+        rows = db.execute("SELECT key, value FROM app_state ORDER BY key").fetchall()
+        assert [(r["key"], r["value"]) for r in rows] == [("a", "10"), ("b", "20")]
+
+
+class TestMigrations:
+    """Test cases for schema migrations."""
+
+    def test_blob_id_migration_keeps_rows(self, monkeypatch):
+        """Should convert TEXT ids of an existing database, keeping rows and references."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            database = Database(Path(tmpdir) / "old.db")
+            monkeypatch.setattr(migrations, "MIGRATIONS", migrations.MIGRATIONS[:3])
+            migrations.apply_migrations(database)
+            monkeypatch.undo()
+
+            template_id, session_id, exercise_id, set_id = (str(uuid4()) for _ in range(4))
+            now = datetime.now()
+            with database.transaction() as cursor:
+                cursor.execute(
+                    "INSERT INTO workout_templates (id, name, created_at) VALUES (?, ?, ?)",
+                    (template_id, "Old Template", now),
+                )
+                cursor.execute(
+                    "INSERT INTO template_exercises VALUES (?, ?, ?, ?, ?)",
+                    (str(uuid4()), template_id, "Squats", 0, 1),
+                )
+                cursor.execute(
+                    "INSERT INTO workout_sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (session_id, template_id, "Old Template", now, now, 600, None),
+                )
+                cursor.execute(
+                    "INSERT INTO session_exercises VALUES (?, ?, ?, ?, ?)",
+                    (exercise_id, session_id, "Squats", 0, 1),
+                )
+                cursor.execute(
+                    "INSERT INTO sets VALUES (?, ?, ?, ?, ?)",
+                    (set_id, exercise_id, 5, 225.0, now),
+                )
+                # A malformed id, referenced by a child row
+                cursor.execute(
+                    "INSERT INTO workout_sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ("not-a-uuid", None, None, now, now, 60, None),
+                )
+                cursor.execute(
+                    "INSERT INTO session_exercises VALUES (?, ?, ?, ?, ?)",
+                    (str(uuid4()), "not-a-uuid", "Dips", 0, 0),
+                )
+
+            assert migrations.apply_migrations(database) == 2
+            assert migrations.get_current_version(database) == migrations.MIGRATIONS[-1][0]
+            assert database.execute("PRAGMA foreign_key_check").fetchall() == []
+
+            repo = SessionRepository(database)
+            session = repo.get_by_id(UUID(session_id))
+            assert session.template_id == UUID(template_id)
+            assert [ex.id for ex in session.exercises] == [UUID(exercise_id)]
+            [workout_set] = session.exercises[0].sets
+            assert workout_set.id == UUID(set_id)
+            assert workout_set.weight == 225.0
+
+            template = TemplateRepository(database).get_by_id(UUID(template_id))
+            assert [ex.name for ex in template.exercises] == ["Squats"]
+
+            malformed = next(s for s in repo.get_all() if s.id != session.id)
+            assert [ex.name for ex in malformed.exercises] == ["Dips"]
+            database.close()
@@ -115,6 +115,16 @@ class Theme:
     WEIGHT_INCREMENT_SMALL = 5
     WEIGHT_INCREMENT_LARGE = 10
 
+    # ==========================================================================
+    # LISTS
+    # ==========================================================================
+
+    # Number of set history rows rendered per page
+    HISTORY_PAGE_SIZE = 10
+
+    # Number of History tab session cards rendered per page
+    SESSION_PAGE_SIZE = 10
+
     # ==========================================================================
     # EMPTY STATE MESSAGES
     # ==========================================================================